@@ -27,6 +27,7 @@ OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.1")  # Llama 3.1 (8B) - High In
 VISION_MODEL = os.getenv("VISION_MODEL", "llava")  # LLaVA (7B) - High Detail
 VISION_ENABLED = True
 SCREENSHOT_MAX_SIZE = 1024  # Max dimension for vision analysis
+OCR_PRECISION = os.getenv("BRO_OCR_PRECISION", "int8").lower()  # "int8" (EasyOCR's CPU quantization) or "fp32"
 
 # =============================================================================
 # WAKE WORD SETTINGS (NEW - Offline via Vosk)
@@ -10,7 +10,8 @@ from .pc_control import (
     open_application, close_application, check_app_running, restart_application,
     open_file, open_folder, take_screenshot, list_processes,
     type_text, press_key, get_system_info,
-    list_installed_apps, search_installed_apps, discover_installed_apps
+    list_installed_apps, search_installed_apps, incremental_search_apps,
+    discover_installed_apps
 )
 
 # File Operations
@@ -56,7 +57,8 @@ __all__ = [
     "open_application", "close_application", "check_app_running", "restart_application",
     "open_file", "open_folder", "take_screenshot", "list_processes",
     "type_text", "press_key", "get_system_info",
-    "list_installed_apps", "search_installed_apps", "discover_installed_apps",
+    "list_installed_apps", "search_installed_apps", "incremental_search_apps",
+    "discover_installed_apps",
     
     # File Ops
     "read_file", "write_file", "list_directory", "search_files",
@@ -6,9 +6,12 @@ All operations are local and secure.
 
 import os
 import sys
+import heapq
+import stat
 import shutil
 import json
 from datetime import datetime
+from operator import itemgetter
 from typing import Optional, List
 from pathlib import Path
 
@@ -16,6 +19,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from tools.registry import tool
 
+if sys.platform == "win32":
+    import ctypes
+
 # =============================================================================
 # COMMON PATHS
 # =============================================================================
@@ -60,6 +66,44 @@ def _format_time(timestamp: float) -> str:
     return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
 
 
+def _is_reparse_point(st: os.stat_result) -> bool:
+    """True for Windows junctions/mount points, which must not be recursed into."""
+    return bool(getattr(st, "st_file_attributes", 0) & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def _fast_rmtree(path: str) -> None:
+    """
+    Permanently delete a directory tree.
+    A symlink or junction passed as the root is removed itself, never emptied.
+    On POSIX this defers to shutil.rmtree, whose fd-based walk guards against
+    symlink swaps. On Windows it is an iterative os.scandir walk; links met
+    inside the tree are removed, not followed.
+    """
+    if os.path.islink(path) or _is_reparse_point(os.lstat(path)):
+        os.unlink(path)
+        return
+    
+    if sys.platform != "win32":
+        shutil.rmtree(path)
+        return
+    
+    stack = [path]
+    while stack:
+        subdirs = []
+        with os.scandir(stack[-1]) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    os.unlink(entry.path)
+                elif _is_reparse_point(entry.stat(follow_symlinks=False)):
+                    os.rmdir(entry.path)
+                else:
+                    subdirs.append(entry.path)
+        if subdirs:
+            stack.extend(subdirs)
+        else:
+            os.rmdir(stack.pop())
+
+
 # =============================================================================
 # FILE LISTING
 # =============================================================================
@@ -442,7 +486,7 @@ def delete_file(file_path: str, confirm: bool = False) -> str:
         except ImportError:
             # Permanent delete
             if target.is_dir():
-                shutil.rmtree(target)
+                _fast_rmtree(str(target))
             else:
                 target.unlink()
             return f"✅ Deleted: {target.name}"
@@ -484,6 +528,8 @@ def disk_usage(drive: str = "C:") -> str:
             drive = drive + ":"
         
         total, used, free = shutil.disk_usage(drive)
+        if not total:
+            return f"💾 Disk Usage: {drive}\n\nDrive reports no capacity (empty or unmounted)."
         
         return f"""💾 Disk Usage: {drive}
 
@@ -495,19 +541,34 @@ Free:  {_format_size(free)} ({free * 100 // total}%)
         return f"❌ Error: {e}"
 
 
+DRIVE_CDROM = 5  # GetDriveTypeW result for optical drives
+
+
+def _logical_drive_letters() -> List[str]:
+    """Return existing drive letters (one GetLogicalDrives call on Windows)."""
+    if sys.platform == "win32":
+        mask = ctypes.windll.kernel32.GetLogicalDrives()
+        return [chr(ord("A") + i) for i in range(26) if mask & (1 << i)]
+    return [letter for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ" if os.path.exists(f"{letter}:\\")]
+
+
 @tool("list_drives", "List available disk drives.")
 def list_drives() -> str:
     """List available disk drives on Windows."""
     try:
         drives = []
-        for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
+        for letter in _logical_drive_letters():
             drive = f"{letter}:\\"
-            if os.path.exists(drive):
-                try:
-                    total, used, free = shutil.disk_usage(drive)
-                    drives.append(f"  💾 {letter}: - {_format_size(total)} total, {_format_size(free)} free")
-                except:
-                    drives.append(f"  💾 {letter}: - (not accessible)")
+            # Empty optical drives make disk_usage slow or raise - don't probe them
+            if sys.platform == "win32":
+                if ctypes.windll.kernel32.GetDriveTypeW(drive) == DRIVE_CDROM:
+                    drives.append(f"  💿 {letter}: - (optical drive)")
+                    continue
+            try:
+                total, used, free = shutil.disk_usage(drive)
+                drives.append(f"  💾 {letter}: - {_format_size(total)} total, {_format_size(free)} free")
+            except:
+                drives.append(f"  💾 {letter}: - (not accessible)")
         
         return "Available Drives:\n" + "\n".join(drives)
     except Exception as e:
@@ -533,27 +594,23 @@ def recent_files(folder: str = "downloads", limit: int = 10) -> str:
         if not target.exists():
             return f"❌ Folder not found: {target}"
         
-        files = []
-        for item in target.iterdir():
-            if item.is_file():
-                try:
-                    stat = item.stat()
-                    files.append({
-                        "name": item.name,
-                        "size": stat.st_size,
-                        "modified": stat.st_mtime
-                    })
-                except:
-                    pass
-        
-        # Sort by modified time (newest first)
-        files.sort(key=lambda x: x["modified"], reverse=True)
+        def _entries():
+            with os.scandir(target) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file():
+                            stat = entry.stat()
+                            yield stat.st_mtime, stat.st_size, entry.name
+                    except OSError:
+                        pass
+        
+        # Keep only the newest `limit` files instead of sorting everything
+        newest = heapq.nlargest(limit, _entries(), key=itemgetter(0))
         
         output = f"📅 Recent files in {folder}:\n\n"
-        for f in files[:limit]:
-            time_str = _format_time(f["modified"])
-            size = _format_size(f["size"])
-            output += f"  📄 {f['name']} ({size}) - {time_str}\n"
+        for modified, size, name in newest:
+            time_str = _format_time(modified)
+            output += f"  📄 {name} ({_format_size(size)}) - {time_str}\n"
         
         return output
         
@@ -39,10 +39,13 @@ def clear_memory(confirm: bool = False) -> str:
         memory_dir = os.path.join(root_dir, "bro_memory")
         
         if os.path.exists(memory_dir):
-            files = [f for f in os.listdir(memory_dir) if f.endswith('.toml')]
-            for f in files:
-                os.remove(os.path.join(memory_dir, f))
-            log.append(f"✅ Deleted {len(files)} TOML memory files.")
+            count = 0
+            with os.scandir(memory_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('.toml') and entry.is_file(follow_symlinks=False):
+                        os.unlink(entry.path)
+                        count += 1
+            log.append(f"✅ Deleted {count} TOML memory files.")
         else:
             log.append("ℹ️ No TOML memory directory found.")
             
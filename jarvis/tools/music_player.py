@@ -6,11 +6,36 @@ Control music playback on your PC and phone.
 import os
 import sys
 import subprocess
+import threading
 import webbrowser
 from typing import Optional
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+if sys.platform == "win32":
+    import ctypes
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+else:
+    _user32 = None
+
+# Virtual-key codes for the media keys
+VK_VOLUME_MUTE = 0xAD
+VK_VOLUME_DOWN = 0xAE
+VK_VOLUME_UP = 0xAF
+VK_MEDIA_NEXT_TRACK = 0xB0
+VK_MEDIA_PREV_TRACK = 0xB1
+VK_MEDIA_PLAY_PAUSE = 0xB3
+KEYEVENTF_KEYUP = 0x0002
+
+
+def _tap(vk: int, presses: int = 1) -> None:
+    """Press and release a virtual key directly through user32."""
+    if _user32 is None:
+        raise OSError("Media keys are only supported on Windows")
+    for _ in range(presses):
+        _user32.keybd_event(vk, 0, 0, 0)
+        _user32.keybd_event(vk, 0, KEYEVENTF_KEYUP, 0)
+
 
 # =============================================================================
 # MUSIC CONTROL (Windows)
@@ -19,11 +44,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 def play_pause() -> str:
     """Toggle play/pause on current media."""
     try:
-        # Use PowerShell to send media keys
-        subprocess.run([
-            "powershell", "-Command",
-            "(New-Object -ComObject WScript.Shell).SendKeys([char]179)"
-        ], capture_output=True)
+        _tap(VK_MEDIA_PLAY_PAUSE)
         return "⏯️ Toggled play/pause"
     except Exception as e:
         return f"Error: {e}"
@@ -32,10 +53,7 @@ def play_pause() -> str:
 def next_track() -> str:
     """Skip to next track."""
     try:
-        subprocess.run([
-            "powershell", "-Command",
-            "(New-Object -ComObject WScript.Shell).SendKeys([char]176)"
-        ], capture_output=True)
+        _tap(VK_MEDIA_NEXT_TRACK)
         return "⏭️ Next track"
     except Exception as e:
         return f"Error: {e}"
@@ -44,10 +62,7 @@ def next_track() -> str:
 def previous_track() -> str:
     """Go to previous track."""
     try:
-        subprocess.run([
-            "powershell", "-Command",
-            "(New-Object -ComObject WScript.Shell).SendKeys([char]177)"
-        ], capture_output=True)
+        _tap(VK_MEDIA_PREV_TRACK)
         return "⏮️ Previous track"
     except Exception as e:
         return f"Error: {e}"
@@ -56,11 +71,7 @@ def previous_track() -> str:
 def volume_up(amount: int = 10) -> str:
     """Increase volume."""
     try:
-        for _ in range(amount // 2):
-            subprocess.run([
-                "powershell", "-Command",
-                "(New-Object -ComObject WScript.Shell).SendKeys([char]175)"
-            ], capture_output=True)
+        _tap(VK_VOLUME_UP, amount // 2)
         return f"🔊 Volume up by {amount}%"
     except Exception as e:
         return f"Error: {e}"
@@ -69,11 +80,7 @@ def volume_up(amount: int = 10) -> str:
 def volume_down(amount: int = 10) -> str:
     """Decrease volume."""
     try:
-        for _ in range(amount // 2):
-            subprocess.run([
-                "powershell", "-Command",
-                "(New-Object -ComObject WScript.Shell).SendKeys([char]174)"
-            ], capture_output=True)
+        _tap(VK_VOLUME_DOWN, amount // 2)
         return f"🔉 Volume down by {amount}%"
     except Exception as e:
         return f"Error: {e}"
@@ -82,10 +89,7 @@ def volume_down(amount: int = 10) -> str:
 def mute() -> str:
     """Toggle mute."""
     try:
-        subprocess.run([
-            "powershell", "-Command",
-            "(New-Object -ComObject WScript.Shell).SendKeys([char]173)"
-        ], capture_output=True)
+        _tap(VK_VOLUME_MUTE)
         return "🔇 Toggled mute"
     except Exception as e:
         return f"Error: {e}"
@@ -131,14 +135,26 @@ def play_on_youtube(song: str) -> str:
 # PHONE MUSIC CONTROL
 # =============================================================================
 
-def phone_music_control(action: str = "play") -> str:
-    """Control music on connected phone."""
-    try:
+_phone_ctrl = None
+_phone_lock = threading.Lock()
+
+
+def _get_phone_controller():
+    """Get the shared, already-connected phone controller (or None)."""
+    global _phone_ctrl
+    if _phone_ctrl is None or _phone_ctrl.device is None:
         from tools.android_control import AndroidController
         ctrl = AndroidController()
         if not ctrl.connect():
-            return "❌ Phone not connected"
-        
+            return None
+        _phone_ctrl = ctrl
+    return _phone_ctrl
+
+
+def phone_music_control(action: str = "play") -> str:
+    """Control music on connected phone."""
+    global _phone_ctrl
+    try:
         key_map = {
             "play": 85,      # KEYCODE_MEDIA_PLAY_PAUSE
             "pause": 85,
@@ -148,7 +164,18 @@ def phone_music_control(action: str = "play") -> str:
         }
         
         keycode = key_map.get(action.lower(), 85)
-        ctrl.device.shell(f"input keyevent {keycode}")
+        
+        # adb sessions aren't reentrant; reuse one connection under a lock
+        with _phone_lock:
+            ctrl = _get_phone_controller()
+            if ctrl is None:
+                return "❌ Phone not connected"
+            try:
+                ctrl.device.shell(f"input keyevent {keycode}")
+            except Exception:
+                # Stale connection - reconnect on the next call
+                _phone_ctrl = None
+                raise
         
         return f"📱 Phone: {action.capitalize()}"
     except Exception as e:
@@ -4,43 +4,112 @@ Uses multiple backends: EasyOCR (offline), Tesseract, or LLaVA vision.
 """
 
 import os
+import re
 import sys
 import json
 import base64
-import urllib.request
-from typing import List, Dict, Optional, Tuple
+import importlib
+import importlib.util
+import threading
+import http.client
+from typing import Any, List, Dict, Optional, Tuple, Union
 from pathlib import Path
+from urllib.parse import urlsplit
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Try to import OCR libraries
-EASYOCR_AVAILABLE = False
-TESSERACT_AVAILABLE = False
-CV2_AVAILABLE = False
+from config import OLLAMA_HOST, OCR_PRECISION
 
-try:
-    import easyocr
-    EASYOCR_AVAILABLE = True
-except ImportError:
-    pass
+# OCR libraries are imported on first use - EasyOCR alone pulls in torch,
+# which would otherwise make every `import tools.ocr` take seconds.
+_backends: Dict[str, object] = {}
 
-try:
-    import pytesseract
-    TESSERACT_AVAILABLE = True
-except ImportError:
-    pass
 
-try:
-    import cv2
-    CV2_AVAILABLE = True
-except ImportError:
-    pass
+def _load_backend(module_name: str):
+    """Import an optional backend once. Returns the module, or None if missing."""
+    if module_name not in _backends:
+        try:
+            _backends[module_name] = importlib.import_module(module_name)
+        except ImportError:
+            _backends[module_name] = None
+    return _backends[module_name]
+
+
+def _available(module_name: str) -> bool:
+    """True if a backend is installed, checked without importing it."""
+    if module_name in _backends:
+        return _backends[module_name] is not None
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _easyocr():
+    return _load_backend("easyocr")
+
+
+def _pytesseract():
+    return _load_backend("pytesseract")
+
 
-try:
-    from PIL import Image
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+def _cv2():
+    return _load_backend("cv2")
+
+
+def _pil_image():
+    return _load_backend("PIL.Image")
+
+
+# Keep-alive connection to the Ollama server at config.OLLAMA_HOST, shared by LLaVA OCR calls
+_OLLAMA_URL = urlsplit(OLLAMA_HOST if "://" in OLLAMA_HOST else f"http://{OLLAMA_HOST}")
+_ollama_conn: Optional[http.client.HTTPConnection] = None
+_ollama_lock = threading.Lock()
+
+
+def _ollama_post(path: str, payload: bytes, timeout: int = 60) -> Dict:
+    """POST JSON to Ollama over a reused connection, reconnecting if it dropped."""
+    global _ollama_conn
+    with _ollama_lock:
+        for attempt in range(2):
+            if _ollama_conn is None:
+                conn_cls = (http.client.HTTPSConnection if _OLLAMA_URL.scheme == "https"
+                            else http.client.HTTPConnection)
+                _ollama_conn = conn_cls(_OLLAMA_URL.hostname or "localhost", _OLLAMA_URL.port,
+                                        timeout=timeout)
+            else:
+                # Apply this call's timeout to the reused connection
+                _ollama_conn.timeout = timeout
+                if _ollama_conn.sock is not None:
+                    _ollama_conn.sock.settimeout(timeout)
+            try:
+                _ollama_conn.request("POST", _OLLAMA_URL.path.rstrip("/") + path, body=payload,
+                                     headers={"Content-Type": "application/json"})
+                resp = _ollama_conn.getresponse()
+                body = resp.read()
+                break
+            except (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                    ConnectionError):
+                # Server closed the idle connection - retry once on a fresh one
+                _ollama_conn.close()
+                _ollama_conn = None
+                if attempt:
+                    raise
+            except Exception:
+                _ollama_conn.close()
+                _ollama_conn = None
+                raise
+    
+    if resp.status != 200:
+        raise RuntimeError(f"Ollama returned HTTP {resp.status}")
+    return json.loads(body.decode())
+
+
+# Placeholder replaced by the raw base64 image bytes in LLaVA requests
+_IMAGE_SLOT = "__BRO_OCR_IMAGE__"
+
+# An image is either a file path or an already-decoded OpenCV (numpy) array
+ImageInput = Union[str, Any]
 
 
 # =============================================================================
@@ -65,22 +134,44 @@ class OCRReader:
     
     def _get_easyocr(self):
         """Lazy load EasyOCR reader."""
-        if self._easyocr_reader is None and EASYOCR_AVAILABLE:
+        if self._easyocr_reader is None:
+            easyocr = _easyocr()
+            if easyocr is None:
+                return None
             print("📥 Loading EasyOCR model (first time may take a moment)...")
-            self._easyocr_reader = easyocr.Reader(self.languages, gpu=True)
+            self._easyocr_reader = easyocr.Reader(
+                self.languages,
+                gpu=True,
+                quantize=OCR_PRECISION != "fp32",
+            )
         return self._easyocr_reader
     
-    def read_easyocr(self, image_path: str) -> List[Dict]:
+    def read_easyocr(self, image: ImageInput) -> List[Dict]:
         """
         Read text using EasyOCR (best for most cases).
+        Accepts a file path or a numpy image array.
         Returns list of detected text with positions and confidence.
         """
         reader = self._get_easyocr()
         if not reader:
             return []
         
-        results = reader.readtext(image_path)
+        return self._format_easyocr(reader.readtext(image))
+    
+    def read_easyocr_batch(self, images: List[Any]) -> List[List[Dict]]:
+        """
+        Read text from several same-sized numpy images in one EasyOCR pass.
+        Returns one result list (as in read_easyocr) per image.
+        """
+        reader = self._get_easyocr()
+        if not reader or not images:
+            return [[] for _ in images]
         
+        batched = reader.readtext_batched(images, batch_size=len(images))
+        return [self._format_easyocr(results) for results in batched]
+    
+    @staticmethod
+    def _format_easyocr(results) -> List[Dict]:
         extracted = []
         for bbox, text, confidence in results:
             extracted.append({
@@ -91,25 +182,38 @@ class OCRReader:
         
         return extracted
     
-    def read_tesseract(self, image_path: str) -> str:
-        """Read text using Tesseract OCR."""
-        if not TESSERACT_AVAILABLE:
+    def read_tesseract(self, image: ImageInput) -> str:
+        """Read text using Tesseract OCR (file path or numpy image array)."""
+        pytesseract = _pytesseract()
+        if pytesseract is None:
             return ""
         
-        if PIL_AVAILABLE:
-            image = Image.open(image_path)
-            return pytesseract.image_to_string(image)
-        elif CV2_AVAILABLE:
-            image = cv2.imread(image_path)
+        if not isinstance(image, str):
+            # pytesseract handles numpy arrays directly
             return pytesseract.image_to_string(image)
         
+        Image = _pil_image()
+        if Image is not None:
+            return pytesseract.image_to_string(Image.open(image))
+        
+        cv2 = _cv2()
+        if cv2 is not None:
+            return pytesseract.image_to_string(cv2.imread(image))
+        
         return ""
     
-    def read_llava(self, image_path: str) -> str:
+    def read_llava(self, image: ImageInput) -> str:
         """Use LLaVA vision model for OCR (fallback)."""
         try:
-            with open(image_path, "rb") as f:
-                img_b64 = base64.b64encode(f.read()).decode()
+            if isinstance(image, str):
+                with open(image, "rb") as f:
+                    img_bytes = f.read()
+            else:
+                ok, encoded = _cv2().imencode(".jpg", image)
+                if not ok:
+                    return "Error: could not encode frame"
+                img_bytes = encoded  # buffer protocol - no copy needed
+            img_b64 = base64.b64encode(img_bytes)
             
             prompt = """OCR Task: Read and transcribe ALL visible text in this image.
             
@@ -121,56 +225,69 @@ Rules:
 
 Output the extracted text directly, nothing else."""
             
-            payload = json.dumps({
+            # Splice the base64 bytes into the JSON body directly instead of
+            # decoding them to str and letting json.dumps copy/escape them again
+            # (base64 is already JSON-safe).
+            prefix, suffix = json.dumps({
                 "model": "llava:7b",
-                "messages": [{"role": "user", "content": prompt, "images": [img_b64]}],
+                "messages": [{"role": "user", "content": prompt, "images": [_IMAGE_SLOT]}],
                 "stream": False,
                 "options": {"temperature": 0.1}
-            }).encode()
-            
-            req = urllib.request.Request(
-                "http://localhost:11434/api/chat",
-                data=payload,
-                headers={"Content-Type": "application/json"}
-            )
+            }).encode().split(_IMAGE_SLOT.encode())
+            payload = b"".join((prefix, img_b64, suffix))
             
-            with urllib.request.urlopen(req, timeout=60) as resp:
-                result = json.loads(resp.read().decode())
-                return result["message"]["content"]
+            result = _ollama_post("/api/chat", payload)
+            return result["message"]["content"]
         
         except Exception as e:
             return f"Error: {e}"
     
-    def read(self, image_path: str, method: str = "auto") -> str:
+    def read(self, image: ImageInput, method: str = "auto") -> str:
         """
         Read text from image using best available method.
         
         Args:
-            image_path: Path to image
+            image: Path to image, or a numpy image array (e.g. a video frame)
             method: "auto", "easyocr", "tesseract", or "llava"
         """
         if method == "auto":
-            if EASYOCR_AVAILABLE:
+            if _available("easyocr"):
                 method = "easyocr"
-            elif TESSERACT_AVAILABLE:
+            elif _available("pytesseract"):
                 method = "tesseract"
             else:
                 method = "llava"
         
         if method == "easyocr":
-            results = self.read_easyocr(image_path)
+            results = self.read_easyocr(image)
             return "\n".join([r["text"] for r in results])
         elif method == "tesseract":
-            return self.read_tesseract(image_path)
+            return self.read_tesseract(image)
         else:
-            return self.read_llava(image_path)
+            return self.read_llava(image)
+    
+    def read_batch(self, images: List[Any], method: str = "auto") -> List[str]:
+        """
+        Read text from several numpy images (e.g. video frames).
+        EasyOCR processes them in a single batched call; other backends
+        fall back to one read per image.
+        """
+        if method == "auto" and _available("easyocr"):
+            method = "easyocr"
+        
+        if method == "easyocr":
+            return [
+                "\n".join([r["text"] for r in results])
+                for results in self.read_easyocr_batch(images)
+            ]
+        return [self.read(image, method) for image in images]
     
     def read_detailed(self, image_path: str) -> Dict:
         """
         Read text with detailed information (position, confidence).
         Only works with EasyOCR.
         """
-        if not EASYOCR_AVAILABLE:
+        if not _available("easyocr"):
             text = self.read(image_path, "auto")
             return {"text": text, "items": [], "method": "fallback"}
         
@@ -188,6 +305,14 @@ Output the extracted text directly, nothing else."""
 # VIDEO OCR
 # =============================================================================
 
+# OCR rarely benefits from frames taller than 1080p
+MAX_OCR_FRAME_HEIGHT = 1080
+
+# Sample gaps up to about one GOP are read sequentially; wider ones seek.
+# grab() still decodes every skipped frame, while a seek decodes at most
+# one keyframe interval, so long gaps are cheaper to jump over.
+SEQUENTIAL_READ_MAX_INTERVAL = 60
+
 def read_video_text(video_path: str, max_frames: int = 5) -> Dict:
     """
     Extract text from video frames.
@@ -196,7 +321,8 @@ def read_video_text(video_path: str, max_frames: int = 5) -> Dict:
         video_path: Path to video file
         max_frames: Number of frames to process
     """
-    if not CV2_AVAILABLE:
+    cv2 = _cv2()
+    if cv2 is None:
         return {"error": "OpenCV required. Run: pip install opencv-python"}
     
     cap = cv2.VideoCapture(video_path)
@@ -206,50 +332,62 @@ def read_video_text(video_path: str, max_frames: int = 5) -> Dict:
     total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
     interval = max(1, total_frames // max_frames)
     
-    reader = OCRReader()
-    all_text = []
-    frame_results = []
+    sequential = interval <= SEQUENTIAL_READ_MAX_INTERVAL
     
-    frame_idx = 0
-    processed = 0
+    frame_indices = []
+    frames = []
     
-    import tempfile
+    frame_idx = 0
     
-    while processed < max_frames:
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+    while len(frames) < max_frames:
+        if sequential:
+            # Short gaps: skip with grab(), which avoids a keyframe re-decode
+            # per sample and the BGR conversion of unsampled frames
+            if frame_idx % interval:
+                if not cap.grab():
+                    break
+                frame_idx += 1
+                continue
+        else:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+        
         ret, frame = cap.read()
         
         if not ret:
             break
         
-        # Save frame temporarily
-        temp_path = os.path.join(tempfile.gettempdir(), f"ocr_frame_{processed}.jpg")
-        cv2.imwrite(temp_path, frame)
-        
-        # Read text
-        text = reader.read(temp_path)
+        # OCR backends work on grayscale anyway - convert once, 1/3 the bytes
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        height = gray.shape[0]
+        if height > MAX_OCR_FRAME_HEIGHT:
+            scale = MAX_OCR_FRAME_HEIGHT / height
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
         
+        frame_indices.append(frame_idx)
+        frames.append(gray)
+        frame_idx += 1 if sequential else interval
+    
+    cap.release()
+    
+    # OCR all sampled frames in one batch - no temp file round-trip
+    reader = OCRReader()
+    frame_results = []
+    
+    # Deduplicate lines as we go (keeps first-seen order)
+    seen = set()
+    unique_text = []
+    
+    for frame_idx, text in zip(frame_indices, reader.read_batch(frames)):
         if text.strip():
             frame_results.append({
                 "frame": frame_idx,
                 "text": text
             })
-            all_text.append(text)
-        
-        # Clean up
-        try:
-            os.remove(temp_path)
-        except:
-            pass
-        
-        frame_idx += interval
-        processed += 1
-    
-    cap.release()
-    
-    # Combine and deduplicate text
-    unique_text = list(set("\n".join(all_text).split("\n")))
-    unique_text = [t.strip() for t in unique_text if t.strip()]
+            for line in text.splitlines():
+                line = line.strip()
+                if line and line not in seen:
+                    seen.add(line)
+                    unique_text.append(line)
     
     return {
         "all_text": unique_text,
@@ -291,24 +429,22 @@ def read_screen() -> str:
     return read_text(screen_path)
 
 
+# All price formats in one pattern so the OCR text is scanned once
+_PRICE_RE = re.compile(
+    r'₹\s*[\d,]+\.?\d*'         # ₹123 or ₹1,234.56
+    r'|Rs\.?\s*[\d,]+\.?\d*'   # Rs.123 or Rs 1,234
+    r'|INR\s*[\d,]+\.?\d*'      # INR 123
+    r'|[\d,]+\.?\d*\s*/-',      # 123/-
+    re.IGNORECASE
+)
+
+
 def read_price(image_path: str) -> str:
     """Extract prices from shopping app screenshot."""
     reader = get_reader()
     text = reader.read(image_path)
     
-    # Look for price patterns
-    import re
-    patterns = [
-        r'₹\s*[\d,]+\.?\d*',      # ₹123 or ₹1,234.56
-        r'Rs\.?\s*[\d,]+\.?\d*',   # Rs.123 or Rs 1,234
-        r'INR\s*[\d,]+\.?\d*',     # INR 123
-        r'[\d,]+\.?\d*\s*/-',      # 123/-
-    ]
-    
-    prices = []
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        prices.extend(matches)
+    prices = _PRICE_RE.findall(text)
     
     if prices:
         return f"Prices found: {', '.join(prices)}\n\nFull text:\n{text}"
@@ -324,10 +460,10 @@ def ocr_status() -> str:
 
 Backends:
 """
-    status += f"  • EasyOCR: {'✅ Available (recommended)' if EASYOCR_AVAILABLE else '❌ Install: pip install easyocr'}\n"
-    status += f"  • Tesseract: {'✅ Available' if TESSERACT_AVAILABLE else '❌ Install: pip install pytesseract'}\n"
+    status += f"  • EasyOCR: {'✅ Available (recommended)' if _available('easyocr') else '❌ Install: pip install easyocr'}\n"
+    status += f"  • Tesseract: {'✅ Available' if _available('pytesseract') else '❌ Install: pip install pytesseract'}\n"
     status += f"  • LLaVA: ✅ Available (fallback)\n"
-    status += f"  • OpenCV: {'✅ Available' if CV2_AVAILABLE else '❌ Install: pip install opencv-python'}\n"
+    status += f"  • OpenCV: {'✅ Available' if _available('cv2') else '❌ Install: pip install opencv-python'}\n"
     
     status += """
 Commands:
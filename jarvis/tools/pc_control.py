@@ -5,22 +5,62 @@ Provides tools for controlling the computer: opening apps, files, folders, etc.
 
 import subprocess
 import os
+import re
 import sys
+import shlex
 import time
+import heapq
 import shutil
+import importlib.util
+import json
+import threading
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
-# Handle imports gracefully if libraries aren't installed yet
+# Handle imports gracefully if libraries aren't installed yet.
+# pyautogui pulls in pymsgbox/mouseinfo/Xlib, so it is only imported on first use.
+PYAUTOGUI_AVAILABLE = importlib.util.find_spec("pyautogui") is not None
+_pyautogui_mod = None
+
+
+def _pyautogui():
+    """Import pyautogui the first time keyboard/mouse control is needed."""
+    global _pyautogui_mod
+    if _pyautogui_mod is None:
+        import pyautogui
+        _pyautogui_mod = pyautogui
+    return _pyautogui_mod
+
+
+# Clipboard access for fast paste-typing (installed alongside pyautogui)
+try:
+    import pyperclip
+    PYPERCLIP_AVAILABLE = True
+except ImportError:
+    PYPERCLIP_AVAILABLE = False
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# Optional: native fast-path screen capture (BitBlt / XShm)
 try:
-    import pyautogui
-    PYAUTOGUI_AVAILABLE = True
+    import mss
+    import mss.tools
+    MSS_AVAILABLE = True
 except ImportError:
-    PYAUTOGUI_AVAILABLE = False
+    MSS_AVAILABLE = False
 
 try:
     import psutil
     PSUTIL_AVAILABLE = True
+    # Prime the non-blocking CPU sampler so the first get_system_info reading is valid
+    psutil.cpu_percent(interval=None)
 except ImportError:
     PSUTIL_AVAILABLE = False
 
@@ -31,11 +71,104 @@ try:
 except ImportError:
     APPOPENER_AVAILABLE = False
 
+# winapps is imported by _scan_winapps when discovery actually runs
+WINAPPS_AVAILABLE = importlib.util.find_spec("winapps") is not None
+
+# Optional: C-accelerated fuzzy matching for app search (typos, word order)
 try:
-    import winapps
-    WINAPPS_AVAILABLE = True
+    from rapidfuzz import process as rf_process, fuzz as rf_fuzz
+    RAPIDFUZZ_AVAILABLE = True
 except ImportError:
-    WINAPPS_AVAILABLE = False
+    RAPIDFUZZ_AVAILABLE = False
+
+# Optional: read .lnk shortcut targets in-process instead of through COM
+try:
+    import LnkParse3
+    LNKPARSE_AVAILABLE = True
+except ImportError:
+    LNKPARSE_AVAILABLE = False
+
+# Direct Win32 window/process management (avoids spawning PowerShell, and lets
+# launches wait on the new process instead of sleep-polling)
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _shell32 = ctypes.WinDLL("shell32", use_last_error=True)
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+    _WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    # Window handles come back as HWND so they compare equal across calls
+    _user32.FindWindowW.restype = wintypes.HWND
+    _user32.GetForegroundWindow.restype = wintypes.HWND
+    
+    class _SHELLEXECUTEINFOW(ctypes.Structure):
+        _fields_ = [
+            ("cbSize", wintypes.DWORD),
+            ("fMask", wintypes.ULONG),
+            ("hwnd", wintypes.HWND),
+            ("lpVerb", wintypes.LPCWSTR),
+            ("lpFile", wintypes.LPCWSTR),
+            ("lpParameters", wintypes.LPCWSTR),
+            ("lpDirectory", wintypes.LPCWSTR),
+            ("nShow", ctypes.c_int),
+            ("hInstApp", wintypes.HINSTANCE),
+            ("lpIDList", ctypes.c_void_p),
+            ("lpClass", wintypes.LPCWSTR),
+            ("hkeyClass", wintypes.HKEY),
+            ("dwHotKey", wintypes.DWORD),
+            ("hIconOrMonitor", wintypes.HANDLE),
+            ("hProcess", wintypes.HANDLE),
+        ]
+    
+    class _PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", wintypes.LONG),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", wintypes.WCHAR * wintypes.MAX_PATH),
+        ]
+    
+    _kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    _kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    for _fn in (_kernel32.Process32FirstW, _kernel32.Process32NextW):
+        _fn.argtypes = [wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+        _fn.restype = wintypes.BOOL
+    INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+    
+    _kernel32.FindFirstFileExW.restype = wintypes.HANDLE
+    _kernel32.FindFirstFileExW.argtypes = [
+        wintypes.LPCWSTR, ctypes.c_int, ctypes.POINTER(wintypes.WIN32_FIND_DATAW),
+        ctypes.c_int, ctypes.c_void_p, wintypes.DWORD,
+    ]
+    _kernel32.FindNextFileW.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.WIN32_FIND_DATAW)]
+    _kernel32.FindClose.argtypes = [wintypes.HANDLE]
+    
+    class _VALENTW(ctypes.Structure):
+        _fields_ = [
+            ("ve_valuename", wintypes.LPWSTR),
+            ("ve_valuelen", wintypes.DWORD),
+            ("ve_valueptr", ctypes.c_size_t),
+            ("ve_type", wintypes.DWORD),
+        ]
+else:
+    _user32 = _shell32 = _kernel32 = _advapi32 = None
+
+SW_RESTORE = 9
+TH32CS_SNAPPROCESS = 0x00000002
+FIND_EX_INFO_BASIC = 1  # Skip the 8.3 short name lookup
+FIND_EX_SEARCH_NAME_MATCH = 0
+FIND_FIRST_EX_LARGE_FETCH = 2  # Fetch directory entries in larger batches
+FILE_ATTRIBUTE_DIRECTORY = 0x10
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+SW_SHOWNORMAL = 1
+SEE_MASK_NOCLOSEPROCESS = 0x00000040
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -95,6 +228,31 @@ APP_PROCESS_MAP = {
     "skype": ["Skype.exe"],
 }
 
+# Common folder shortcuts (expanded once at import)
+FOLDER_MAPPINGS = {
+    "documents": os.path.expanduser("~\\Documents"),
+    "downloads": os.path.expanduser("~\\Downloads"),
+    "desktop": os.path.expanduser("~\\Desktop"),
+    "pictures": os.path.expanduser("~\\Pictures"),
+    "music": os.path.expanduser("~\\Music"),
+    "videos": os.path.expanduser("~\\Videos"),
+    "home": os.path.expanduser("~"),
+}
+
+# Lower-cased process names per app, for O(1) membership checks
+APP_PROCESS_SET = {
+    app: frozenset(name.lower() for name in names)
+    for app, names in APP_PROCESS_MAP.items()
+}
+
+
+def _expected_process_names(app_name: str) -> frozenset:
+    """Lower-cased process names that identify a running app."""
+    app_lower = app_name.lower()
+    # For unknown apps, try matching the name directly
+    return APP_PROCESS_SET.get(app_lower) or frozenset([f"{app_lower}.exe"])
+
+
 # =============================================================================
 # AUTO-DISCOVERY: Dynamically find all installed apps on the PC
 # =============================================================================
@@ -102,120 +260,298 @@ APP_PROCESS_MAP = {
 # Cache for discovered apps (name -> path)
 _discovered_apps_cache = {}
 _cache_initialized = False
+_discovery_lock = threading.Lock()
+
+# Discovery results persist across runs, reused while the scanned locations are unchanged
+APPS_CACHE_DIR = Path(os.path.dirname(os.path.dirname(__file__))) / "bro_memory"
+APPS_CACHE_FILE = APPS_CACHE_DIR / "apps_cache.json"
+
+# Locations scanned for installed apps
+_HOME = os.path.expanduser("~")
+START_MENU_DIRS = (
+    os.path.join(os.environ.get("PROGRAMDATA", "C:\\ProgramData"), "Microsoft\\Windows\\Start Menu\\Programs"),
+    os.path.join(_HOME, "AppData\\Roaming\\Microsoft\\Windows\\Start Menu\\Programs"),
+)
+COMMON_APP_DIRS = (
+    r"C:\Program Files",
+    r"C:\Program Files (x86)",
+    os.path.join(_HOME, "AppData\\Local\\Programs"),
+    os.path.join(_HOME, "AppData\\Local"),
+    os.path.join(_HOME, "AppData\\Roaming"),
+)
+# Registry paths where apps are typically registered, as (hive name, key path)
+UNINSTALL_KEYS = (
+    ("HKEY_LOCAL_MACHINE", r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
+    ("HKEY_LOCAL_MACHINE", r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
+    ("HKEY_CURRENT_USER", r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
+)
+
+
+def _list_dir(path: str):
+    """
+    Yield (name, is_dir) for each entry in path; links to directories are not
+    treated as directories. On Windows, lists with FindFirstFileExW in basic,
+    large-fetch mode - fewer kernel round trips than os.scandir.
+    """
+    if _kernel32 is None:
+        with os.scandir(path) as it:
+            for entry in it:
+                yield entry.name, entry.is_dir(follow_symlinks=False)
+        return
+    
+    data = wintypes.WIN32_FIND_DATAW()
+    handle = _kernel32.FindFirstFileExW(
+        os.path.join(path, "*"), FIND_EX_INFO_BASIC, ctypes.byref(data),
+        FIND_EX_SEARCH_NAME_MATCH, None, FIND_FIRST_EX_LARGE_FETCH,
+    )
+    if handle == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        while True:
+            name = data.cFileName
+            if name not in (".", ".."):
+                attrs = data.dwFileAttributes
+                yield name, bool(attrs & FILE_ATTRIBUTE_DIRECTORY) and not attrs & FILE_ATTRIBUTE_REPARSE_POINT
+            if not _kernel32.FindNextFileW(handle, ctypes.byref(data)):
+                break
+    finally:
+        _kernel32.FindClose(handle)
+
+
+def _walk_lnks(path: str):
+    """Yield the path of every .lnk file under path (recursive)."""
+    try:
+        for name, is_dir in _list_dir(path):
+            child = os.path.join(path, name)
+            if is_dir:
+                yield from _walk_lnks(child)
+            elif name.endswith(".lnk"):
+                yield child
+    except OSError:
+        pass  # Missing or unreadable folder
+
+
+# COM objects belong to the thread that created them, so the shell is cached per thread
+_com_local = threading.local()
+
+
+def _wscript_shell():
+    """This thread's WScript.Shell COM object for resolving shortcuts, or None without pywin32."""
+    shell = getattr(_com_local, "shell", None)
+    if shell is None:
+        try:
+            import win32com.client
+        except ImportError:
+            return None
+        shell = _com_local.shell = win32com.client.Dispatch("WScript.Shell")
+    return shell
+
+
+def _parse_shortcut(lnk_path: str) -> Optional[str]:
+    """Read a shortcut's target straight from the .lnk file with LnkParse3, or None."""
+    if not LNKPARSE_AVAILABLE:
+        return None
+    try:
+        with open(lnk_path, "rb") as f:
+            info = LnkParse3.lnk_file(f).get_json().get("link_info") or {}
+    except Exception:
+        return None
+    # The Unicode fields, when present, avoid guessing the ANSI codepage
+    base = info.get("local_base_path_unicode") or info.get("local_base_path")
+    if not base:
+        return None  # e.g. network or environment-variable targets
+    suffix = info.get("common_path_suffix_unicode") or info.get("common_path_suffix") or ""
+    return base + suffix
+
+
+def _com_shortcut_target(lnk_path: str) -> Optional[str]:
+    """Target path of a .lnk file via WScript.Shell (call from the scanning thread only)."""
+    shell = _wscript_shell()
+    if shell is None:
+        return None
+    try:
+        return shell.CreateShortCut(lnk_path).Targetpath
+    except Exception:
+        return None
+
+
+def _exe_target(target: Optional[str]) -> Optional[str]:
+    """target if it is an existing .exe, else None."""
+    if target and target.lower().endswith(".exe") and os.path.exists(target):
+        return target
+    return None
+
+
+# Worker threads for the I/O-bound discovery scans (file reads and stats)
+SCAN_WORKERS = 8
 
 
 def _scan_start_menu() -> dict:
     """Scan Start Menu shortcuts to find installed apps."""
-    apps = {}
-    start_menu_paths = [
-        os.path.join(os.environ.get("PROGRAMDATA", "C:\\ProgramData"), "Microsoft\\Windows\\Start Menu\\Programs"),
-        os.path.join(os.path.expanduser("~"), "AppData\\Roaming\\Microsoft\\Windows\\Start Menu\\Programs"),
-    ]
+    lnk_paths = [lnk for start_path in START_MENU_DIRS for lnk in _walk_lnks(start_path)]
     
-    try:
-        import win32com.client
-        shell = win32com.client.Dispatch("WScript.Shell")
-        
-        for start_path in start_menu_paths:
-            if not os.path.exists(start_path):
-                continue
-            for root, dirs, files in os.walk(start_path):
-                for file in files:
-                    if file.endswith(".lnk"):
-                        try:
-                            shortcut_path = os.path.join(root, file)
-                            shortcut = shell.CreateShortCut(shortcut_path)
-                            target = shortcut.Targetpath
-                            if target and os.path.exists(target) and target.lower().endswith(".exe"):
-                                app_name = file[:-4].lower()  # Remove .lnk
-                                apps[app_name] = target
-                        except:
-                            pass
-    except ImportError:
-        # win32com not available, use basic approach
-        pass
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        targets = list(pool.map(_exe_target, pool.map(_parse_shortcut, lnk_paths)))
     
+    # Anything LnkParse3 could not turn into an existing .exe (unparsed, wrong
+    # codepage, unexpanded variables) gets a second opinion from COM, which
+    # is bound to this thread
+    for i, target in enumerate(targets):
+        if target is None:
+            targets[i] = _exe_target(_com_shortcut_target(lnk_paths[i]))
+    
+    apps = {}
+    for lnk_path, target in zip(lnk_paths, targets):
+        if target:
+            apps[os.path.basename(lnk_path)[:-4].lower()] = target  # Remove .lnk
     return apps
 
 
+# Values read from each Uninstall subkey
+_UNINSTALL_VALUES = ("DisplayName", "InstallLocation")
+ERROR_MORE_DATA = 234
+REG_SZ = 1
+REG_EXPAND_SZ = 2
+
+
+def _query_uninstall_values(subkey) -> Optional[tuple]:
+    """
+    Read DisplayName and InstallLocation from an open Uninstall subkey in a
+    single RegQueryMultipleValuesW call.
+    
+    Returns:
+        (display_name, install_location), or None if either is missing
+    """
+    if _advapi32 is None:
+        import winreg
+        try:
+            return tuple(winreg.QueryValueEx(subkey, name)[0] for name in _UNINSTALL_VALUES)
+        except OSError:
+            return None
+    
+    entries = (_VALENTW * len(_UNINSTALL_VALUES))()
+    for entry, name in zip(entries, _UNINSTALL_VALUES):
+        entry.ve_valuename = name
+    
+    # On ERROR_MORE_DATA, size is updated to the length needed - retry with that
+    size = wintypes.DWORD(1024)
+    while True:
+        buf = ctypes.create_string_buffer(size.value)
+        status = _advapi32.RegQueryMultipleValuesW(
+            wintypes.HKEY(subkey.handle), entries, len(entries), buf, ctypes.byref(size)
+        )
+        if status != ERROR_MORE_DATA:
+            break
+    if status != 0:
+        return None
+    
+    values = []
+    for entry in entries:
+        if entry.ve_type not in (REG_SZ, REG_EXPAND_SZ):
+            return None
+        values.append(ctypes.wstring_at(entry.ve_valueptr, entry.ve_valuelen // 2).rstrip("\0"))
+    return tuple(values)
+
+
+# Per Uninstall key: [last-write time, {app name: exe}] from the last scan.
+# Persisted in apps_cache.json so unchanged keys are never re-enumerated.
+_registry_key_cache = {}
+
+
 def _scan_registry() -> dict:
     """Scan Windows Registry for installed applications."""
     apps = {}
     import winreg
     
-    # Registry paths where apps are typically registered
-    reg_paths = [
-        (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
-        (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
-        (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
-    ]
-    
-    for hkey, path in reg_paths:
+    for hive, path in UNINSTALL_KEYS:
+        key_id = f"{hive}\\{path}"
         try:
-            key = winreg.OpenKey(hkey, path)
-            for i in range(winreg.QueryInfoKey(key)[0]):
+            key = winreg.OpenKey(getattr(winreg, hive), path)
+            subkey_count, _, last_write = winreg.QueryInfoKey(key)
+            
+            # No app added or removed under this key since the cached scan
+            cached = _registry_key_cache.get(key_id)
+            if cached and cached[0] == last_write:
+                apps.update(cached[1])
+                winreg.CloseKey(key)
+                continue
+            
+            key_apps = {}
+            for i in range(subkey_count):
                 try:
                     subkey_name = winreg.EnumKey(key, i)
                     subkey = winreg.OpenKey(key, subkey_name)
                     try:
-                        display_name = winreg.QueryValueEx(subkey, "DisplayName")[0]
-                        try:
-                            install_location = winreg.QueryValueEx(subkey, "InstallLocation")[0]
+                        # Both values in one registry call
+                        values = _query_uninstall_values(subkey)
+                        if values:
+                            display_name, install_location = values
                             if install_location and os.path.exists(install_location):
                                 # Look for .exe files in install location
                                 for file in os.listdir(install_location):
                                     if file.lower().endswith(".exe"):
                                         app_name = display_name.lower()
-                                        apps[app_name] = os.path.join(install_location, file)
+                                        key_apps[app_name] = os.path.join(install_location, file)
                                         break
-                        except WindowsError:
-                            pass
                     except WindowsError:
                         pass
                     winreg.CloseKey(subkey)
                 except WindowsError:
                     pass
             winreg.CloseKey(key)
+            apps.update(key_apps)
+            _registry_key_cache[key_id] = [last_write, key_apps]
         except WindowsError:
             pass
     
     return apps
 
 
+# An app executable: any .exe except uninstallers (unins000.exe etc.), in one C-level match
+_APP_EXE_RE = re.compile(r"(?!unins).*\.exe$", re.IGNORECASE)
+
+
+def _find_exe_in_folder(folder_path: str, folder: str) -> Optional[str]:
+    """The app executable in an install folder: <folder>.exe, else the first non-uninstaller .exe."""
+    preferred = f"{folder}.exe".lower()
+    first_exe = None
+    # One directory listing: stop as soon as <folder>.exe turns up
+    try:
+        with os.scandir(folder_path) as it:
+            for entry in it:
+                if not _APP_EXE_RE.match(entry.name) or not entry.is_file():
+                    continue
+                if entry.name.lower() == preferred:
+                    return entry.path
+                if first_exe is None:
+                    first_exe = entry.path
+    except OSError:
+        pass
+    return first_exe
+
+
 def _scan_common_paths() -> dict:
     """Scan common installation directories for apps."""
-    apps = {}
-    common_dirs = [
-        r"C:\Program Files",
-        r"C:\Program Files (x86)",
-        os.path.join(os.path.expanduser("~"), "AppData\\Local\\Programs"),
-        os.path.join(os.path.expanduser("~"), "AppData\\Local"),
-        os.path.join(os.path.expanduser("~"), "AppData\\Roaming"),
-    ]
-    
-    for base_dir in common_dirs:
-        if not os.path.exists(base_dir):
-            continue
+    folders = []
+    for base_dir in COMMON_APP_DIRS:
         try:
-            for folder in os.listdir(base_dir):
-                folder_path = os.path.join(base_dir, folder)
-                if os.path.isdir(folder_path):
-                    # Look for .exe with same name as folder
-                    exe_path = os.path.join(folder_path, f"{folder}.exe")
-                    if os.path.exists(exe_path):
-                        apps[folder.lower()] = exe_path
-                    else:
-                        # Find any .exe in the folder
-                        try:
-                            for file in os.listdir(folder_path):
-                                if file.lower().endswith(".exe") and not file.startswith("unins"):
-                                    apps[folder.lower()] = os.path.join(folder_path, file)
-                                    break
-                        except PermissionError:
-                            pass
-        except PermissionError:
-            pass
+            with os.scandir(base_dir) as it:
+                folders.extend((entry.path, entry.name) for entry in it if entry.is_dir())
+        except OSError:
+            pass  # Missing or inaccessible
     
+    # Probe install folders concurrently; merge on this thread in scan order
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        exes = pool.map(
+            _find_exe_in_folder,
+            [folder_path for folder_path, _ in folders],
+            [folder for _, folder in folders],
+        )
+    
+    apps = {}
+    for (_, folder), exe_path in zip(folders, exes):
+        if exe_path:
+            apps[folder.lower()] = exe_path
     return apps
 
 
@@ -224,12 +560,13 @@ def _scan_winapps() -> dict:
     apps = {}
     if WINAPPS_AVAILABLE:
         try:
+            import winapps
             for app in winapps.list_installed():
                 if app.install_location and os.path.exists(app.install_location):
                     # Find .exe in install location
                     try:
                         for file in os.listdir(app.install_location):
-                            if file.lower().endswith(".exe") and not file.startswith("unins"):
+                            if _APP_EXE_RE.match(file):
                                 apps[app.name.lower()] = os.path.join(app.install_location, file)
                                 break
                     except:
@@ -239,6 +576,49 @@ def _scan_winapps() -> dict:
     return apps
 
 
+def _discovery_token() -> list:
+    """
+    Cheap fingerprint of the scanned locations: folder mtimes plus the
+    Uninstall keys' last-write times. Changes when apps are (un)installed.
+    """
+    token = []
+    for folder in START_MENU_DIRS + COMMON_APP_DIRS:
+        try:
+            token.append(os.stat(folder).st_mtime_ns)
+        except OSError:
+            token.append(0)
+    try:
+        import winreg
+    except ImportError:
+        return token
+    for hive, path in UNINSTALL_KEYS:
+        try:
+            with winreg.OpenKey(getattr(winreg, hive), path) as key:
+                token.append(winreg.QueryInfoKey(key)[2])
+        except OSError:
+            token.append(0)
+    return token
+
+
+def _read_apps_cache() -> dict:
+    """Contents of the discovery cache saved by a previous run, or {}."""
+    try:
+        with open(APPS_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_apps_cache(token: list, apps: dict):
+    """Persist discovered apps (and per-key registry results) for the next run."""
+    try:
+        APPS_CACHE_DIR.mkdir(exist_ok=True)
+        with open(APPS_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"token": token, "apps": apps, "registry": _registry_key_cache}, f)
+    except OSError:
+        pass  # Cache is an optimization only
+
+
 def discover_installed_apps(force_refresh: bool = False) -> dict:
     """
     Discover all installed applications on the PC.
@@ -256,36 +636,161 @@ def discover_installed_apps(force_refresh: bool = False) -> dict:
     if _cache_initialized and not force_refresh:
         return _discovered_apps_cache
     
-    discovered = {}
-    
-    # Method 1: Scan Start Menu (most reliable)
-    try:
-        discovered.update(_scan_start_menu())
-    except:
-        pass
-    
-    # Method 2: Scan Registry
+    with _discovery_lock:
+        # Another thread may have finished the scan while we waited
+        if _cache_initialized and not force_refresh:
+            return _discovered_apps_cache
+        
+        # Reuse the previous run's scan if nothing has been installed or removed since
+        token = _discovery_token()
+        if force_refresh:
+            _registry_key_cache.clear()
+        else:
+            saved = _read_apps_cache()
+            if saved.get("token") == token and saved.get("apps") is not None:
+                _discovered_apps_cache = saved["apps"]
+                _cache_initialized = True
+                return _discovered_apps_cache
+            # Something changed - still skip registry keys that didn't
+            _registry_key_cache.update(saved.get("registry") or {})
+        
+        discovered = {}
+        
+        # Method 1: Scan Start Menu (most reliable)
+        try:
+            discovered.update(_scan_start_menu())
+        except:
+            pass
+        
+        # Method 2: Scan Registry
+        try:
+            discovered.update(_scan_registry())
+        except:
+            pass
+        
+        # Method 3: Scan common paths
+        try:
+            discovered.update(_scan_common_paths())
+        except:
+            pass
+        
+        # Method 4: Use winapps library
+        try:
+            discovered.update(_scan_winapps())
+        except:
+            pass
+        
+        _discovered_apps_cache = discovered
+        _cache_initialized = True
+        _save_apps_cache(token, discovered)
+        
+    return discovered
+
+
+def _prewarm_app_discovery():
+    """Fill the discovered-apps cache in the background so the first 'open ...' doesn't wait on it."""
     try:
-        discovered.update(_scan_registry())
-    except:
+        import pythoncom
+        pythoncom.CoInitialize()  # Shortcut resolution may use COM on this thread
+    except ImportError:
         pass
-    
-    # Method 3: Scan common paths
     try:
-        discovered.update(_scan_common_paths())
-    except:
+        discover_installed_apps()
+    except Exception:
         pass
+
+
+if sys.platform == "win32":
+    threading.Thread(target=_prewarm_app_discovery, name="app-discovery", daemon=True).start()
+
+
+# Bigram indexes over discovered app names and paths, rebuilt when the app dict changes
+_app_index = None
+
+
+def _bigrams(text: str) -> set:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _get_app_index(apps: dict) -> dict:
+    """Index for apps: names/lowered paths in discovery order, name positions, bigram postings per field."""
+    global _app_index
+    if _app_index is None or _app_index["source"] is not apps:
+        names = list(apps)
+        paths = [path.lower() for path in apps.values()]
+        postings = {}
+        for field, texts in (("names", names), ("paths", paths)):
+            field_postings = postings[field] = {}
+            for i, text in enumerate(texts):
+                for gram in _bigrams(text):
+                    field_postings.setdefault(gram, []).append(i)
+        _app_index = {
+            "source": apps,
+            "names": names,
+            "paths": paths,
+            "positions": {name: i for i, name in enumerate(names)},
+            "postings": postings,
+        }
+    return _app_index
+
+
+def _candidates_containing(query: str, index: dict, field: str = "names") -> list:
+    """
+    Positions of apps whose `field` ("names" or "paths") might contain query, in discovery order.
+    Any text containing query contains all of its bigrams, so only the rarest
+    postings need checking; callers still confirm with `in`.
+    """
+    grams = _bigrams(query)
+    if not grams:
+        return range(len(index["names"]))  # Too short to index - check everything
+    field_postings = index["postings"][field]
+    postings = sorted((field_postings.get(gram, []) for gram in grams), key=len)
+    hits = set(postings[0])
+    for posting in postings[1:]:
+        hits.intersection_update(posting)
+        if not hits:
+            break
+    return sorted(hits)
+
+
+def _fuzzy_app_match(query: str, apps: dict) -> Optional[str]:
+    """Path of the first discovered app whose name contains query or is contained in it."""
+    index = _get_app_index(apps)
+    names = index["names"]
     
-    # Method 4: Use winapps library
-    try:
-        discovered.update(_scan_winapps())
-    except:
-        pass
+    first = None
+    for i in _candidates_containing(query, index):
+        if query in names[i]:
+            first = i
+            break
     
-    _discovered_apps_cache = discovered
-    _cache_initialized = True
+    # Names contained in the query are among its substrings
+    positions = index["positions"]
+    for start in range(len(query)):
+        for end in range(start + 1, len(query) + 1):
+            i = positions.get(query[start:end])
+            if i is not None and (first is None or i < first):
+                first = i
+    if "" in positions and (first is None or positions[""] < first):
+        first = positions[""]
     
-    return discovered
+    return None if first is None else apps[names[first]]
+
+
+@lru_cache(maxsize=256)
+def _which(name: str) -> Optional[str]:
+    """Resolve a command on PATH, trying `name.exe` too (cached - PATH rarely changes mid-session)."""
+    found = shutil.which(name)
+    if found is None and not name.endswith(".exe"):
+        found = shutil.which(name + ".exe")
+    return found
+
+
+@lru_cache(maxsize=128)
+def _static_app_path(app_lower: str) -> Optional[str]:
+    """Configured path for an app from config (cached), or None if not configured."""
+    path = get_app_path(app_lower)
+    return None if path == app_lower else path
 
 
 def find_app_path(app_name: str) -> str:
@@ -302,50 +807,181 @@ def find_app_path(app_name: str) -> str:
     app_lower = app_name.lower().strip()
     
     # 1. Check static config first (fastest)
-    static_path = get_app_path(app_name)
-    if static_path != app_name and (os.path.exists(static_path) or static_path.endswith(":")):
+    static_path = _static_app_path(app_lower)
+    if static_path and (os.path.exists(static_path) or static_path.endswith(":")):
         return static_path
     
     # 2. Check discovered apps cache
     discovered = discover_installed_apps()
     
-    # Exact match
-    if app_lower in discovered:
-        return discovered[app_lower]
+    # Exact match - one dict lookup, before any fuzzy or PATH probing
+    exact_path = discovered.get(app_lower)
+    if exact_path is not None:
+        return exact_path
     
     # Fuzzy match (contains)
-    for name, path in discovered.items():
-        if app_lower in name or name in app_lower:
-            return path
+    fuzzy_path = _fuzzy_app_match(app_lower, discovered)
+    if fuzzy_path is not None:
+        return fuzzy_path
     
-    # 3. Check if it's in PATH
-    which_path = shutil.which(app_lower)
+    # 3. Check if it's in PATH (cached lookup)
+    which_path = _which(app_lower)
     if which_path:
         return which_path
     
     return app_name
 
 
-def is_app_running(app_name: str) -> bool:
-    """Check if an application is currently running."""
+# Back-to-back tool calls (e.g. check_app_running then open_application, or a
+# get_system_info UI refresh) reuse readings from the last 250ms
+_STATS_TTL = 0.25  # seconds
+_stats_cache = {}
+
+
+def _cached_stat(key: str, fetch):
+    """Return fetch() or its result from the last _STATS_TTL seconds."""
+    now = time.monotonic()
+    hit = _stats_cache.get(key)
+    if hit is not None and now - hit[0] < _STATS_TTL:
+        return hit[1]
+    value = fetch()
+    _stats_cache[key] = (now, value)
+    return value
+
+
+def _iter_procs(attrs: list):
+    """
+    Iterate running processes, prefetching only `attrs` for each.
+    psutil>=6.0 dropped the per-process create_time() PID-reuse check
+    from process_iter, which made this the cheap path for name scans.
+    """
+    return psutil.process_iter(attrs)
+
+
+def _iter_process_names():
+    """
+    Yield the lower-cased name of every running process.
+    On Linux, reads /proc/<pid>/comm directly and on Windows takes a Toolhelp
+    snapshot - both far cheaper than building psutil Process objects when
+    only names are needed.
+    """
+    if sys.platform.startswith("linux"):
+        for pid in os.listdir("/proc"):
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f"/proc/{pid}/comm") as f:
+                    yield f.read().strip().lower()
+            except OSError:
+                pass  # Process exited mid-scan
+        return
+    
+    if _kernel32 is not None:
+        yield from _toolhelp_process_names()
+        return
+    
+    for proc in _iter_procs(['name']):
+        yield (proc.info['name'] or "").lower()
+
+
+def _toolhelp_process_names():
+    """
+    Yield lower-cased exe names from one CreateToolhelp32Snapshot - a single
+    kernel snapshot instead of opening every process the way psutil does.
+    """
+    snapshot = _kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not snapshot or snapshot == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        entry = _PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(entry)
+        ok = _kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while ok:
+            yield entry.szExeFile.lower()
+            ok = _kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        _kernel32.CloseHandle(wintypes.HANDLE(snapshot))
+
+
+def _running_process_names() -> frozenset:
+    """Lower-cased names of all running processes, from a scan at most _STATS_TTL old."""
+    return _cached_stat("process_names", lambda: frozenset(_iter_process_names()))
+
+
+def _invalidate_process_names() -> None:
+    """Drop the cached process snapshot after starting or stopping processes."""
+    _stats_cache.pop("process_names", None)
+
+
+def is_app_running(app_name: str, running_names: Optional[set] = None, fresh: bool = False) -> bool:
+    """
+    Check if an application is currently running.
+    
+    Args:
+        app_name: Name of the app
+        running_names: Optional snapshot from _running_process_names() to
+                       check against instead of scanning processes again
+        fresh: Scan now instead of using the short-lived cached snapshot
+    """
     if not PSUTIL_AVAILABLE:
         return False
     
-    app_lower = app_name.lower()
-    expected = APP_PROCESS_MAP.get(app_lower, [])
+    expected = _expected_process_names(app_name)
+    
+    if fresh:
+        # any() stops at the first matching process
+        return any(name in expected for name in _iter_process_names())
     
-    if not expected:
-        # For unknown apps, try matching the name directly
-        expected = [f"{app_lower}.exe"]
+    if running_names is None:
+        running_names = _running_process_names()
+    return not expected.isdisjoint(running_names)
+
+
+def _wait_for_app(app_name: str, timeout: float, poll: float = 0.1, max_poll: float = 0.8) -> bool:
+    """
+    Poll until the app's process appears. Returns False if `timeout` passes first.
+    The poll interval doubles after each miss (up to `max_poll`), so fast-starting
+    apps are caught quickly without rescanning processes every 100ms for slow ones.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if is_app_running(app_name, fresh=True):
+            _invalidate_process_names()
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(poll, remaining))
+        poll = min(poll * 2, max_poll)
+
+
+def _start_and_wait_idle(target: str, idle_timeout_ms: int = 2000) -> None:
+    """
+    Opens target like os.startfile, then blocks until the new process is ready
+    for input (or idle_timeout_ms passes) instead of sleeping between checks.
+    URIs and apps handed to an already-running instance return immediately.
     
-    for proc in psutil.process_iter(['name']):
+    Raises:
+        OSError: If the shell cannot open target
+    """
+    if _shell32 is None:
+        os.startfile(target)
+        return
+    
+    info = _SHELLEXECUTEINFOW()
+    info.cbSize = ctypes.sizeof(info)
+    info.fMask = SEE_MASK_NOCLOSEPROCESS
+    info.lpVerb = "open"
+    info.lpFile = target
+    info.nShow = SW_SHOWNORMAL
+    if not _shell32.ShellExecuteExW(ctypes.byref(info)):
+        raise ctypes.WinError(ctypes.get_last_error())
+    
+    if info.hProcess:
         try:
-            proc_name = proc.info['name'].lower()
-            if proc_name in [e.lower() for e in expected]:
-                return True
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            pass
-    return False
+            _user32.WaitForInputIdle(info.hProcess, idle_timeout_ms)
+        finally:
+            _kernel32.CloseHandle(info.hProcess)
 
 
 @tool("check_app_running", "Checks if an application is currently running on the computer.")
@@ -371,22 +1007,17 @@ def close_application(app_name: str) -> str:
     if not PSUTIL_AVAILABLE:
         return "❌ Cannot close apps: psutil not installed."
     
-    app_lower = app_name.lower()
-    expected = APP_PROCESS_MAP.get(app_lower, [])
+    expected = _expected_process_names(app_name)
     
-    if not expected:
-        # For unknown apps, try matching the name directly
-        expected = [f"{app_lower}.exe"]
-    
-    closed_count = 0
+    terminated = []
     errors = []
     
-    for proc in psutil.process_iter(['pid', 'name']):
+    for proc in _iter_procs(['pid', 'name']):
         try:
-            proc_name = proc.info['name'].lower()
-            if proc_name in [e.lower() for e in expected]:
+            proc_name = proc.info['name']
+            if proc_name and proc_name.lower() in expected:
                 proc.terminate()  # Graceful termination
-                closed_count += 1
+                terminated.append(proc)
         except psutil.NoSuchProcess:
             pass
         except psutil.AccessDenied:
@@ -394,6 +1025,17 @@ def close_application(app_name: str) -> str:
         except Exception as e:
             errors.append(str(e))
     
+    if terminated:
+        _invalidate_process_names()
+        # Wait for all of them in one batch; force-kill whatever ignores terminate
+        _, alive = psutil.wait_procs(terminated, timeout=2.0)
+        for proc in alive:
+            try:
+                proc.kill()
+            except psutil.NoSuchProcess:
+                pass
+    
+    closed_count = len(terminated)
     if closed_count > 0:
         return f"✓ Closed {app_name}! ({closed_count} process{'es' if closed_count > 1 else ''} terminated)"
     elif errors:
@@ -420,8 +1062,8 @@ def list_installed_apps(refresh: bool = False, limit: int = 50) -> str:
         if not apps:
             return "❌ No applications discovered. Try installing pywin32 for better discovery: pip install pywin32"
         
-        # Sort alphabetically
-        sorted_apps = sorted(apps.items(), key=lambda x: x[0])[:limit]
+        # First `limit` alphabetically, without sorting every app
+        sorted_apps = heapq.nsmallest(limit, apps.items(), key=lambda x: x[0])
         
         result = f"📦 Discovered {len(apps)} installed applications:\n"
         result += "-" * 50 + "\n"
@@ -456,11 +1098,24 @@ def search_installed_apps(query: str) -> str:
         apps = discover_installed_apps()
         query_lower = query.lower().strip()
         
-        # Find matching apps
-        matches = []
-        for name, path in apps.items():
-            if query_lower in name or query_lower in path.lower():
-                matches.append((name, path))
+        # Find matching apps (only those whose name or path shares all of the query's bigrams)
+        index = _get_app_index(apps)
+        names, paths = index["names"], index["paths"]
+        by_name = [i for i in _candidates_containing(query_lower, index, "names") if query_lower in names[i]]
+        by_path = [i for i in _candidates_containing(query_lower, index, "paths") if query_lower in paths[i]]
+        matches = [(names[i], apps[names[i]]) for i in sorted(set(by_name).union(by_path))]
+        
+        if not matches and RAPIDFUZZ_AVAILABLE and query_lower:
+            # No substring hit (e.g. a typo) - fall back to the closest names
+            closest = rf_process.extract(
+                query_lower, names, scorer=rf_fuzz.WRatio, limit=20, score_cutoff=60
+            )
+            if closest:
+                result = f"🔍 No exact match for '{query}'. Closest apps:\n"
+                result += "-" * 50 + "\n"
+                for name, _score, _ in closest:
+                    result += f"  • {name}\n    Path: {apps[name]}\n"
+                return result
         
         if not matches:
             return f"❌ No apps found matching '{query}'. Try a different search term."
@@ -468,7 +1123,7 @@ def search_installed_apps(query: str) -> str:
         result = f"🔍 Found {len(matches)} apps matching '{query}':\n"
         result += "-" * 50 + "\n"
         
-        for name, path in sorted(matches)[:20]:
+        for name, path in heapq.nsmallest(20, matches):
             result += f"  • {name}\n    Path: {path}\n"
         
         if len(matches) > 20:
@@ -479,6 +1134,97 @@ def search_installed_apps(query: str) -> str:
     except Exception as e:
         return f"❌ Error searching apps: {str(e)}"
 
+class IncrementalMatcher:
+    """
+    Edit distance from a growing query to the best-matching part of each
+    candidate name (so "chro" matches "google chrome" exactly). Keeps each
+    candidate's DP rows, so one more typed character costs one new row per
+    candidate instead of the whole table.
+    """
+    
+    def __init__(self, candidates):
+        self.candidates = list(candidates)
+        self.query = ""
+        # _history[i][k]: DP row for candidate k after i query characters.
+        # The empty query matches anywhere for free.
+        self._history = [[[0] * (len(c) + 1) for c in self.candidates]]
+    
+    def extend(self, char: str):
+        """Add one character to the query."""
+        rows = []
+        for cand, prev in zip(self.candidates, self._history[-1]):
+            row = [prev[0] + 1]
+            for j, cand_char in enumerate(cand, 1):
+                row.append(min(
+                    prev[j] + 1,                         # delete
+                    row[j - 1] + 1,                      # insert
+                    prev[j - 1] + (cand_char != char),   # substitute / match
+                ))
+            rows.append(row)
+        self._history.append(rows)
+        self.query += char
+    
+    def set_query(self, query: str):
+        """Move to query, reusing the rows for the prefix it shares with the current one."""
+        common = 0
+        for a, b in zip(self.query, query):
+            if a != b:
+                break
+            common += 1
+        del self._history[common + 1:]
+        self.query = self.query[:common]
+        for char in query[common:]:
+            self.extend(char)
+    
+    def top_k(self, k: int) -> list:
+        """The k best (distance, candidate) pairs; ties go to shorter names."""
+        rows = self._history[-1]
+        best = heapq.nsmallest(
+            k, range(len(self.candidates)),
+            key=lambda i: (min(rows[i]), len(self.candidates[i]))
+        )
+        return [(min(rows[i]), self.candidates[i]) for i in best]
+
+
+# Matcher for incremental_search_apps, rebuilt when the discovered apps change
+_app_matcher = None
+_app_matcher_source = None
+
+
+@tool("incremental_search_apps", "Finds installed apps matching a partially typed or misspelled app name. Use while the user is still spelling out an app.")
+def incremental_search_apps(query: str, limit: int = 10) -> str:
+    """
+    Typo-tolerant prefix search over installed apps. Successive calls whose
+    queries extend the previous one only compute the newly typed characters.
+    
+    Args:
+        query: The app name typed so far
+        limit: Maximum number of suggestions (default 10)
+        
+    Returns:
+        Closest app names with their paths
+    """
+    global _app_matcher, _app_matcher_source
+    try:
+        apps = discover_installed_apps()
+        if not apps:
+            return "❌ No applications discovered."
+        
+        if _app_matcher is None or _app_matcher_source is not apps:
+            _app_matcher = IncrementalMatcher(apps)
+            _app_matcher_source = apps
+        
+        _app_matcher.set_query(query.lower().strip())
+        
+        result = f"🔍 Closest apps to '{query}':\n"
+        result += "-" * 50 + "\n"
+        for distance, name in _app_matcher.top_k(limit):
+            result += f"  • {name} (edits: {distance})\n    Path: {apps[name]}\n"
+        return result
+        
+    except Exception as e:
+        return f"❌ Error searching apps: {str(e)}"
+
 @tool("open_application", "Launches an application. Use this for 'open', 'start', 'launch' commands. Handles focusing if already open.")
 def open_application(app_name: str) -> str:
     """
@@ -497,10 +1243,15 @@ def open_application(app_name: str) -> str:
     try:
         app_lower = app_name.lower().strip()
         
+        # Known apps can be verified by process name after launching
+        can_verify = PSUTIL_AVAILABLE and app_lower in APP_PROCESS_MAP
+        
         # 0. Check if already running (for known apps) - FOCUS instead of re-opening
-        if app_lower in APP_PROCESS_MAP and is_app_running(app_name):
-            focus_msg = focus_window(app_name)
-            return f"✓ {app_name} is already running. {focus_msg}"
+        if can_verify:
+            running_before = _running_process_names()
+            if is_app_running(app_name, running_before):
+                focus_msg = focus_window(app_name)
+                return f"✓ {app_name} is already running. {focus_msg}"
         
         # =====================================================================
         # LAYER 1: SPEED SHORTCUTS (URI schemes, direct commands, known paths)
@@ -510,30 +1261,24 @@ def open_application(app_name: str) -> str:
         
         # Detect if this is a URI scheme (ends with :) or file path
         is_uri_scheme = target.endswith(":") or "://" in target
-        is_file_path = os.path.exists(target) or is_uri_scheme
+        is_file_path = is_uri_scheme or os.path.exists(target)
         
-        # Smart Fallback: If path doesn't exist, try shutil.which (for PATH commands)
+        # Smart Fallback: If path doesn't exist, look it up on PATH (for PATH commands)
         if not is_file_path:
-            which_path = shutil.which(target)
+            which_path = _which(target)
             if which_path:
                 target = which_path
                 is_file_path = True
-            elif not target.endswith(".exe") and shutil.which(target + ".exe"):
-                target = shutil.which(target + ".exe")
-                is_file_path = True
         
         # Try Layer 1: os.startfile (handles .exe, URIs, file associations)
         if is_file_path or is_uri_scheme:
             try:
-                os.startfile(target)
-                time.sleep(0.8)
+                _start_and_wait_idle(target)
                 
-                # Verify launch for known apps
-                if PSUTIL_AVAILABLE and app_lower in APP_PROCESS_MAP:
-                    for _ in range(5):
-                        if is_app_running(app_name):
-                            return f"✓ Layer 1 Success: '{app_name}' is running."
-                        time.sleep(0.5)
+                # Verify launch for known apps - usually already up once the
+                # launched process is input-idle, so the first check succeeds
+                if can_verify and _wait_for_app(app_name, timeout=3.3):
+                    return f"✓ Layer 1 Success: '{app_name}' is running."
                 
                 return f"✓ Layer 1: Opened '{app_name}' via {target}"
             except OSError:
@@ -545,14 +1290,10 @@ def open_application(app_name: str) -> str:
         if APPOPENER_AVAILABLE:
             try:
                 app_opener_open(app_lower, match_closest=True, throw_error=True)
-                time.sleep(1)
                 
                 # Verify launch
-                if PSUTIL_AVAILABLE and app_lower in APP_PROCESS_MAP:
-                    for _ in range(5):
-                        if is_app_running(app_name):
-                            return f"✓ Layer 2 Success: '{app_name}' found and launched via registry."
-                        time.sleep(0.5)
+                if can_verify and _wait_for_app(app_name, timeout=3.5):
+                    return f"✓ Layer 2 Success: '{app_name}' found and launched via registry."
                 
                 return f"✓ Layer 2: Opened '{app_name}' via AppOpener registry scan."
             except Exception:
@@ -560,16 +1301,28 @@ def open_application(app_name: str) -> str:
         
         # Try subprocess as intermediate fallback
         try:
-            result = subprocess.Popen(target, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            time.sleep(1)
+            # Launch directly rather than through a cmd.exe/sh middleman; Windows
+            # CreateProcess parses the command line itself.
+            args = target if sys.platform == "win32" else shlex.split(target)
+            result = subprocess.Popen(
+                args,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
             
-            if result.poll() is None or result.returncode == 0:
-                # Check if app is now running
-                if PSUTIL_AVAILABLE and app_lower in APP_PROCESS_MAP:
-                    for _ in range(3):
-                        if is_app_running(app_name):
-                            return f"✓ Subprocess Success: '{app_name}' launched."
-                        time.sleep(0.5)
+            # Give the command up to a second to fail; wait() wakes as soon as
+            # the process exits rather than polling
+            try:
+                result.wait(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                # Still running: we hold the launched process itself, no scan needed
+                return f"✓ Subprocess Success: '{app_name}' launched (PID {result.pid})."
+            
+            if result.returncode == 0:
+                # A launcher that exited cleanly - check the app it started
+                if can_verify and _wait_for_app(app_name, timeout=1.5):
+                    return f"✓ Subprocess Success: '{app_name}' launched."
                 return f"✓ Command Started: {target}"
         except Exception:
             pass  # Move to Layer 3
@@ -579,19 +1332,25 @@ def open_application(app_name: str) -> str:
         # =====================================================================
         if PYAUTOGUI_AVAILABLE:
             try:
-                pyautogui.press('win')
+                _pyautogui().press('win')
                 time.sleep(0.3)
-                pyautogui.write(app_lower, interval=0.05)
+                _pyautogui().write(app_lower, interval=0.05)
                 time.sleep(1.0)  # Wait for Windows Search to find the app
-                pyautogui.press('enter')
-                time.sleep(1.5)  # Wait for app to launch
+                _pyautogui().press('enter')
                 
                 # Verify launch
-                if PSUTIL_AVAILABLE and app_lower in APP_PROCESS_MAP:
-                    for _ in range(5):
-                        if is_app_running(app_name):
-                            return f"✓ Layer 3 Success: '{app_name}' launched via Windows Search."
-                        time.sleep(0.5)
+                if can_verify:
+                    if _wait_for_app(app_name, timeout=4.0):
+                        return f"✓ Layer 3 Success: '{app_name}' launched via Windows Search."
+                elif _user32 is not None:
+                    # Unknown process name - watch for its window instead
+                    deadline = time.monotonic() + 1.5
+                    while time.monotonic() < deadline:
+                        if _window_exists(app_name):
+                            return f"✓ Layer 3 Success: Verified window '{app_name}' is open."
+                        time.sleep(0.1)
+                else:
+                    time.sleep(1.5)  # Wait for app to launch
                 
                 return f"✓ Layer 3: Launched '{app_name}' via Windows Search (visual fallback)."
             except Exception as e:
@@ -605,11 +1364,76 @@ def open_application(app_name: str) -> str:
 
 
 
+# Longest wait for a focused window to become the foreground window
+FOCUS_SETTLE_TIMEOUT = 0.5
+
+
+def _find_window(window_title: str) -> int:
+    """
+    Finds the first visible top-level window whose title contains window_title.
+    
+    Returns:
+        The window handle, or 0 if nothing matches
+    """
+    wanted = window_title.lower()
+    found = []
+    
+    def _check(hwnd, _lparam):
+        if not _user32.IsWindowVisible(hwnd):
+            return True
+        length = _user32.GetWindowTextLengthW(hwnd)
+        if not length:
+            return True
+        buf = ctypes.create_unicode_buffer(length + 1)
+        _user32.GetWindowTextW(hwnd, buf, length + 1)
+        if wanted in buf.value.lower():
+            found.append(hwnd)
+            return False  # Stop enumerating
+        return True
+    
+    _user32.EnumWindows(_WNDENUMPROC(_check), 0)
+    return found[0] if found else 0
+
+
+def _window_exists(window_title: str) -> bool:
+    """True if a visible window's title matches window_title (exact or partial)."""
+    if _user32 is None:
+        return False
+    return bool(_user32.FindWindowW(None, window_title) or _find_window(window_title))
+
+
+def _activate_window(window_title: str) -> bool:
+    """Brings a window to the front through user32. Returns True on success."""
+    if _user32 is None:
+        return False
+    hwnd = _user32.FindWindowW(None, window_title) or _find_window(window_title)
+    if not hwnd:
+        return False
+    if _user32.IsIconic(hwnd):
+        _user32.ShowWindow(hwnd, SW_RESTORE)
+    if not _user32.SetForegroundWindow(hwnd):
+        return False
+    
+    # Wait for the switch to land so following keystrokes reach this window
+    deadline = time.monotonic() + FOCUS_SETTLE_TIMEOUT
+    while _user32.GetForegroundWindow() != hwnd and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return True
+
+
 @tool("focus_window", "Brings a specific window to the front. Use ONLY if the user explicitly asks to 'focus' or 'switch to' a window.")
 def focus_window(window_title: str) -> str:
     """
-    Focuses a window by title using PowerShell.
+    Focuses a window by title (exact or partial, case-insensitive).
+    
+    Uses user32 directly; falls back to PowerShell's AppActivate.
     """
+    try:
+        if _activate_window(window_title):
+            return f"Focused window: {window_title}"
+    except Exception:
+        pass  # Fall back to PowerShell below
+    
     try:
         cmd = f"""
         $w = New-Object -ComObject WScript.Shell
@@ -634,15 +1458,36 @@ def restart_application(app_name: str) -> str:
     Returns:
         Status message
     """
-    close_res = close_application(app_name)
-    time.sleep(2) # Wait for full close
+    close_res = close_application(app_name)  # Waits until the processes are gone
     open_res = open_application(app_name)
     
     return f"🔄 Restarted {app_name}:\n{close_res}\n{open_res}"
 
 
+# Text longer than this is pasted via the clipboard instead of typed key by key
+PASTE_THRESHOLD = 20
+
+# How long the target app gets to read the clipboard before it is restored
+PASTE_SETTLE_TIME = 0.3
+
+
+def _paste_text(text: str) -> None:
+    """Enter text with one Ctrl+V, restoring the user's clipboard afterwards."""
+    previous = pyperclip.paste()
+    pyperclip.copy(text)
+    try:
+        _pyautogui().hotkey('ctrl', 'v')
+        time.sleep(PASTE_SETTLE_TIME)
+    finally:
+        # Only a failed paste should make type_text fall back to typing the text
+        try:
+            pyperclip.copy(previous)
+        except Exception:
+            pass
+
+
 @tool("type_text", "Types text. Optional: provide 'window' to focus first (e.g. window='notepad')")
-def type_text(text: str, window: str = None, interval: float = 0.05) -> str:
+def type_text(text: str, window: str = None, interval: float = 0.05, pre_delay: float = 0.0) -> str:
     """
     Types text using the keyboard. Can focus a window first.
     
@@ -650,6 +1495,9 @@ def type_text(text: str, window: str = None, interval: float = 0.05) -> str:
         text: The text to type
         window: (Optional) Name of window to focus first
         interval: Delay between key presses (default 0.05s)
+        pre_delay: Seconds to wait before typing (default 0). Only needed when
+                   the target window isn't ready yet - open_application already
+                   waits for the app to launch.
         
     Returns:
         Success message
@@ -662,11 +1510,19 @@ def type_text(text: str, window: str = None, interval: float = 0.05) -> str:
         if window:
             msg += focus_window(window) + ". "
         
-        # Give user time to switch focus if running manually, but for BRO
-        # we usually open an app first. Add small safety delay.
-        time.sleep(0.5) 
+        if pre_delay > 0:
+            time.sleep(pre_delay)
         
-        pyautogui.write(text, interval=interval)
+        # Typing costs `interval` per character; paste long text in one go
+        pasted = False
+        if PYPERCLIP_AVAILABLE and len(text) > PASTE_THRESHOLD and interval <= 0.05:
+            try:
+                _paste_text(text)
+                pasted = True
+            except Exception:
+                pass  # Clipboard unavailable (e.g. locked by another app) - type instead
+        if not pasted:
+            _pyautogui().write(text, interval=interval)
         return f"{msg}Typed: {text}"
     except Exception as e:
         return f"Error typing text: {str(e)}"
@@ -688,7 +1544,7 @@ def press_key(key: str, times: int = 1) -> str:
         return "Error: pyautogui is not installed"
         
     try:
-        pyautogui.press(key, presses=times)
+        _pyautogui().press(key, presses=times)
         return f"Pressed key: {key} ({times} times)"
     except Exception as e:
         return f"Error pressing key: {str(e)}"
@@ -706,16 +1562,22 @@ def open_file(file_path: str) -> str:
         A message indicating success or failure
     """
     try:
-        if not os.path.exists(file_path):
-            return f"File not found: {file_path}"
-        
-        # Use os.startfile on Windows to open with default app
+        # Use os.startfile on Windows to open with default app; it reports a
+        # missing file itself, so there's no need for a separate exists() stat
         os.startfile(file_path)
         return f"Opened file: {file_path}"
+    except FileNotFoundError:
+        return f"File not found: {file_path}"
     except Exception as e:
         return f"Error opening file: {str(e)}"
 
 
+@lru_cache(maxsize=None)
+def _mapped_folder_exists(folder_path: str) -> bool:
+    """os.path.exists for the fixed FOLDER_MAPPINGS targets."""
+    return os.path.exists(folder_path)
+
+
 @tool("open_folder", "Opens a folder in File Explorer")
 def open_folder(folder_path: str) -> str:
     """
@@ -728,58 +1590,86 @@ def open_folder(folder_path: str) -> str:
         A message indicating success or failure
     """
     try:
-        # Expand common folder shortcuts
-        folder_mappings = {
-            "documents": os.path.expanduser("~\\Documents"),
-            "downloads": os.path.expanduser("~\\Downloads"),
-            "desktop": os.path.expanduser("~\\Desktop"),
-            "pictures": os.path.expanduser("~\\Pictures"),
-            "music": os.path.expanduser("~\\Music"),
-            "videos": os.path.expanduser("~\\Videos"),
-            "home": os.path.expanduser("~"),
-        }
-        
-        # Check if it's a shortcut name
-        folder_lower = folder_path.lower()
-        if folder_lower in folder_mappings:
-            folder_path = folder_mappings[folder_lower]
+        # Expand common folder shortcuts (their existence is checked once per session)
+        mapped_path = FOLDER_MAPPINGS.get(folder_path.lower())
+        if mapped_path is not None:
+            folder_path = mapped_path
+            exists = _mapped_folder_exists(folder_path)
+        else:
+            exists = os.path.exists(folder_path)
         
-        if not os.path.exists(folder_path):
+        if not exists:
             return f"Folder not found: {folder_path}"
         
-        subprocess.Popen(f'explorer "{folder_path}"')
+        # ShellExecute opens the folder directly; explorer argv is the fallback
+        if hasattr(os, "startfile"):
+            os.startfile(folder_path)
+        else:
+            subprocess.Popen([_which("explorer") or "explorer", folder_path])
         return f"Opened folder: {folder_path}"
     except Exception as e:
         return f"Error opening folder: {str(e)}"
 
 
+def _grab_screen():
+    """Capture the primary monitor as a PIL image (mss fast path, pyautogui fallback)."""
+    if MSS_AVAILABLE and PIL_AVAILABLE:
+        with mss.mss() as sct:
+            shot = sct.grab(sct.monitors[1])
+        return Image.frombytes("RGB", shot.size, shot.bgra, "raw", "BGRX")
+    return _pyautogui().screenshot()
+
+
 @tool("take_screenshot", "Takes a screenshot of the current screen and saves it")
-def take_screenshot(save_path: Optional[str] = None) -> str:
+def take_screenshot(save_path: Optional[str] = None, quality: str = "fast") -> str:
     """
     Takes a screenshot of the current screen.
     
     Args:
         save_path: Optional path to save the screenshot. If not provided, saves to Pictures folder.
+        quality: "fast" for quick light PNG compression (default), or "small" to
+                 quantize to a 256-color palette (pngquant if installed) for ~70% smaller files
         
     Returns:
         The path where the screenshot was saved
     """
-    if not PYAUTOGUI_AVAILABLE:
-        return "Error: pyautogui is not installed. Run: pip install pyautogui"
+    if not ((MSS_AVAILABLE and PIL_AVAILABLE) or PYAUTOGUI_AVAILABLE):
+        return "Error: no screenshot backend installed. Run: pip install mss"
     
     try:
         if save_path is None:
             # Create a default filename with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            pictures_folder = os.path.expanduser("~\\Pictures")
-            save_path = os.path.join(pictures_folder, f"screenshot_{timestamp}.png")
+            save_path = os.path.join(FOLDER_MAPPINGS["pictures"], f"screenshot_{timestamp}.png")
         
         # Ensure directory exists
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
         
+        is_png = save_path.lower().endswith(".png")
+        
+        if MSS_AVAILABLE and is_png and quality != "small":
+            # Encode the raw capture straight to PNG, skipping the PIL round-trip
+            with mss.mss() as sct:
+                shot = sct.grab(sct.monitors[1])
+            mss.tools.to_png(shot.rgb, shot.size, level=1, output=save_path)
+            return f"Screenshot saved to: {save_path}"
+        
         # Take the screenshot
-        screenshot = pyautogui.screenshot()
-        screenshot.save(save_path)
+        screenshot = _grab_screen()
+        
+        if quality == "small" and is_png:
+            pngquant = _which("pngquant")
+            if pngquant:
+                screenshot.save(save_path, compress_level=1)
+                subprocess.run(
+                    [pngquant, "--force", "--skip-if-larger", "--output", save_path, "256", save_path],
+                    capture_output=True
+                )
+            else:
+                screenshot.quantize(colors=256).save(save_path, optimize=True)
+        else:
+            # Default DEFLATE level 6 is slow on large screens; level 1 is ~2x faster
+            screenshot.save(save_path, compress_level=1)
         
         return f"Screenshot saved to: {save_path}"
     except Exception as e:
@@ -801,41 +1691,58 @@ def list_processes(limit: int = 15) -> str:
         return "Error: psutil is not installed. Run: pip install psutil"
     
     try:
-        processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'memory_percent']):
-            try:
-                info = proc.info
-                processes.append({
-                    'pid': info['pid'],
-                    'name': info['name'],
-                    'memory': info['memory_percent']
-                })
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+        def _proc_infos():
+            for proc in _iter_procs(['pid', 'name', 'memory_info']):
+                try:
+                    info = proc.info
+                    mem_info = info['memory_info']
+                    yield info['pid'], info['name'] or "", mem_info.rss if mem_info else None
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+        
+        # Keep only the top `limit` by resident memory instead of sorting everything
+        top = heapq.nlargest(limit, _proc_infos(), key=lambda p: p[2] or 0)
         
-        # Sort by memory usage
-        processes.sort(key=lambda x: x['memory'] or 0, reverse=True)
+        # Same figure as memory_percent(), with the RAM total read once
+        total_mem = _cached_stat("memory", psutil.virtual_memory).total
         
         # Format output
-        result = "Top running processes:\n"
-        result += "-" * 50 + "\n"
-        result += f"{'PID':<10} {'Name':<30} {'Memory %':<10}\n"
-        result += "-" * 50 + "\n"
+        lines = [
+            "Top running processes:",
+            "-" * 50,
+            f"{'PID':<10} {'Name':<30} {'Memory %':<10}",
+            "-" * 50,
+        ]
         
-        for proc in processes[:limit]:
-            mem = f"{proc['memory']:.1f}%" if proc['memory'] else "N/A"
-            result += f"{proc['pid']:<10} {proc['name'][:28]:<30} {mem:<10}\n"
+        for pid, name, rss in top:
+            mem = f"{rss / total_mem * 100:.1f}%" if rss else "N/A"
+            lines.append(f"{pid:<10} {name[:28]:<30} {mem:<10}")
         
-        return result
+        lines.append("")
+        return "\n".join(lines)
     except Exception as e:
         return f"Error listing processes: {str(e)}"
 
 
+@lru_cache(maxsize=None)
+def _cpu_count() -> int:
+    """Logical CPU count - fixed for the session."""
+    return psutil.cpu_count()
+
+
+# Disk reported by get_system_info: the Windows system drive, else the root fs
+SYSTEM_DISK = os.environ.get("SystemDrive", "C:") + "\\" if sys.platform == "win32" else "/"
+
+
 @tool("get_system_info", "Gets basic system information like CPU, memory, and disk usage")
-def get_system_info() -> str:
+def get_system_info(interval: float = 0.0) -> str:
     """
     Gets basic system information.
     
+    Args:
+        interval: Seconds to sample CPU usage over. By default returns instantly
+            with usage since the previous call (0.0 right after startup).
+    
     Returns:
         A formatted string with system information
     """
@@ -843,18 +1750,19 @@ def get_system_info() -> str:
         return "Error: psutil is not installed. Run: pip install psutil"
     
     try:
-        # CPU info
-        cpu_percent = psutil.cpu_percent(interval=1)
-        cpu_count = psutil.cpu_count()
+        # CPU info - usage since the previous call (non-blocking; readings
+        # taken less than ~100ms apart are not meaningful)
+        cpu_percent = psutil.cpu_percent(interval=interval or None)
+        cpu_count = _cpu_count()
         
         # Memory info
-        memory = psutil.virtual_memory()
+        memory = _cached_stat("memory", psutil.virtual_memory)
         mem_total = memory.total / (1024 ** 3)  # GB
         mem_used = memory.used / (1024 ** 3)
         mem_percent = memory.percent
         
         # Disk info
-        disk = psutil.disk_usage('/')
+        disk = _cached_stat("disk", lambda: psutil.disk_usage(SYSTEM_DISK))
         disk_total = disk.total / (1024 ** 3)
         disk_used = disk.used / (1024 ** 3)
         disk_percent = disk.percent
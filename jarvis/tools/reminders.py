@@ -4,13 +4,20 @@ Quick notes and time-based reminders.
 """
 
 import os
+import re
 import sys
 import json
+import atexit
+import bisect
 import threading
 import time
+import copy
+from collections import deque
+from itertools import chain
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -37,133 +44,326 @@ except ImportError:
 DATA_DIR = Path(os.path.dirname(os.path.dirname(__file__))) / "bro_memory"
 NOTES_FILE = DATA_DIR / "notes.toml"
 REMINDERS_FILE = DATA_DIR / "reminders.toml"
+REMINDERS_LOG = DATA_DIR / "reminders.log"  # JSONL of reminders marked done since the last save
+
+
+@lru_cache(maxsize=8)
+def _parse_toml(path: Path, mtime_ns: int, size: int) -> dict:
+    """Parse a TOML file; keyed on its stat so edits on disk are re-read."""
+    with open(path, "rb") as f:
+        return tomllib.load(f)
 
 
 def _load_toml(path: Path, default: dict) -> dict:
-    """Load TOML file."""
+    """Load TOML file (parsed once per on-disk version)."""
     try:
-        if path.exists() and tomllib:
-            with open(path, "rb") as f:
-                return tomllib.load(f)
+        if tomllib:
+            st = path.stat()
+            # Callers mutate what they get, so hand out a copy of the cached parse
+            return copy.deepcopy(_parse_toml(path, st.st_mtime_ns, st.st_size))
     except:
         pass
     return default.copy()
 
 
+# Value formatters for the fallback TOML writer, keyed by exact type (bool before int)
+_TOML_FORMATTERS = {
+    str: lambda v: f'"{v}"',
+    bool: lambda v: "true" if v else "false",
+}
+
+
+def _toml_value(value) -> str:
+    """Format a scalar for the fallback TOML writer."""
+    return _TOML_FORMATTERS.get(type(value), str)(value)
+
+
 def _save_toml(path: Path, data: dict):
     """Save TOML file."""
     DATA_DIR.mkdir(exist_ok=True)
     
+    # Serialize to one string, then write it in a single call
     if TOML_WRITE:
-        with open(path, "wb") as f:
-            tomli_w.dump(data, f)
+        text = tomli_w.dumps(data)
     else:
         # Fallback: simple TOML
-        lines = []
+        parts = []
         for key, value in data.items():
             if isinstance(value, list):
                 for item in value:
-                    lines.append(f"[[{key}]]")
-                    for k, v in item.items():
-                        if isinstance(v, str):
-                            lines.append(f'{k} = "{v}"')
-                        elif isinstance(v, bool):
-                            lines.append(f'{k} = {"true" if v else "false"}')
-                        else:
-                            lines.append(f'{k} = {v}')
-                    lines.append("")
+                    parts.append(f"[[{key}]]\n")
+                    parts.extend(f"{k} = {_toml_value(v)}\n" for k, v in item.items())
+                    parts.append("\n")
             else:
-                if isinstance(value, str):
-                    lines.append(f'{key} = "{value}"')
-                else:
-                    lines.append(f'{key} = {value}')
-        
-        with open(path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+                parts.append(f"{key} = {_toml_value(value)}\n")
+        text = "".join(parts)
+    
+    path.write_text(text, encoding="utf-8")
+
+
+FLUSH_INTERVAL = 5.0  # Minimum seconds between rewrites of a store file
+
+
+class _DebouncedStore:
+    """
+    Base for managers backed by one TOML file.
+    
+    Changes call _mark_dirty() instead of saving directly: a change after a
+    quiet period is written at once, further changes within FLUSH_INTERVAL
+    are coalesced into one deferred write, and anything pending is flushed
+    at exit.
+    
+    Args:
+        path: TOML file to write
+        items: Returns the records to save under [[items]]
+        after_flush: Optional callback run after each rewrite
+    """
+    
+    def __init__(self, path: Path, items: Callable[[], List[Dict]],
+                 after_flush: Optional[Callable[[], None]] = None):
+        self._path = path
+        self._get_items = items
+        self._after_flush = after_flush
+        self._dirty = False
+        self._last_flush = 0.0
+        self._flush_timer = None
+        self._flush_lock = threading.Lock()
+        atexit.register(self._flush)
+    
+    def _mark_dirty(self):
+        """Record a change and save now or schedule a deferred save."""
+        with self._flush_lock:
+            self._dirty = True
+            wait = self._last_flush + FLUSH_INTERVAL - time.monotonic()
+            if wait <= 0:
+                self._flush_locked()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(wait, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _flush(self):
+        """Write pending changes to disk."""
+        with self._flush_lock:
+            self._flush_locked()
+    
+    def _flush_locked(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._dirty:
+            _save_toml(self._path, {"items": self._get_items()})
+            if self._after_flush:
+                self._after_flush()
+            self._dirty = False
+            self._last_flush = time.monotonic()
+
+
+def _index_by_id(items: List[Dict]) -> Dict[int, Dict]:
+    """Key loaded records by id, renumbering duplicate ids left by older versions."""
+    by_id = {}
+    next_id = max((item["id"] for item in items), default=0) + 1
+    for item in items:
+        if item["id"] in by_id:
+            item["id"] = next_id
+            next_id += 1
+        by_id[item["id"]] = item
+    return by_id
 
 
 # =============================================================================
 # NOTES
 # =============================================================================
 
-class NoteManager:
+_WORD_RE = re.compile(r"\w+")
+
+
+class NoteManager(_DebouncedStore):
     """Quick notes manager."""
     
     def __init__(self):
-        self.notes = _load_toml(NOTES_FILE, {"items": []}).get("items", [])
+        super().__init__(NOTES_FILE, items=self._snapshot)
+        self._by_id = _index_by_id(_load_toml(NOTES_FILE, {"items": []}).get("items", []))
+        self._next_id = max(self._by_id, default=0) + 1
+        self._content_lower = {i: n["content"].lower() for i, n in self._by_id.items()}
+        self._inverted: Dict[str, set] = {}  # word -> ids of notes containing it
+        self._inv_dirty = True
+        self._lock = threading.Lock()  # guards the records; the flush timer reads them
+    
+    def _snapshot(self) -> List[Dict]:
+        """Current notes, copied under the lock for the flush timer."""
+        with self._lock:
+            return list(self._by_id.values())
+    
+    def _rebuild_inverted(self):
+        """Rebuild the word -> note id index."""
+        inverted = {}
+        for note_id, content_lower in self._content_lower.items():
+            for word in set(_WORD_RE.findall(content_lower)):
+                inverted.setdefault(word, set()).add(note_id)
+        self._inverted = inverted
+        self._inv_dirty = False
+    
+    def _candidate_ids(self, query: str) -> Optional[set]:
+        """
+        Ids of notes that may contain query as a substring.
+        
+        Only words with a non-word character on both sides in the query are
+        looked up: those must appear as whole words in a matching note. The
+        first and last words may be cut off mid-word, so they cannot narrow
+        the search. Returns None (check every note) when there is no such word.
+        """
+        if self._inv_dirty:
+            self._rebuild_inverted()
+        
+        candidates = None
+        for match in _WORD_RE.finditer(query):
+            if match.start() == 0 or match.end() == len(query):
+                continue
+            ids = self._inverted.get(match.group(), set())
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                break
+        return candidates
     
     def add(self, content: str, tags: List[str] = None) -> str:
         """Add a quick note."""
-        note = {
-            "id": len(self.notes) + 1,
-            "content": content,
-            "tags": ",".join(tags) if tags else "",
-            "created": datetime.now().isoformat(),
-            "pinned": False
-        }
-        self.notes.append(note)
-        _save_toml(NOTES_FILE, {"items": self.notes})
+        with self._lock:
+            note = {
+                "id": self._next_id,
+                "content": content,
+                "tags": ",".join(tags) if tags else "",
+                "created": datetime.now().isoformat(),
+                "pinned": False
+            }
+            self._next_id += 1
+            self._by_id[note["id"]] = note
+            self._content_lower[note["id"]] = content.lower()
+            self._inv_dirty = True
+        self._mark_dirty()
         return f"📝 Note saved! (#{note['id']})"
     
     def list_all(self, limit: int = 10) -> str:
         """List recent notes."""
-        if not self.notes:
-            return "📝 No notes yet. Add one with: note('your note here')"
+        # Show pinned first, then recent (one pass; the deque keeps the last `limit`)
+        pinned = []
+        recent = deque(maxlen=limit if limit > 0 else None)
+        with self._lock:
+            if not self._by_id:
+                return "📝 No notes yet. Add one with: note('your note here')"
+            for n in self._by_id.values():
+                (pinned if n.get("pinned") else recent).append(n)
         
-        output = "📝 YOUR NOTES\n" + "="*40 + "\n\n"
+        parts = ["📝 YOUR NOTES\n" + "="*40 + "\n\n"]
         
-        # Show pinned first, then recent
-        pinned = [n for n in self.notes if n.get("pinned")]
-        recent = [n for n in self.notes if not n.get("pinned")][-limit:]
-        
-        for note in pinned + recent:
+        for note in chain(pinned, recent):
             pin = "📌 " if note.get("pinned") else ""
             tags = f" [{note['tags']}]" if note.get("tags") else ""
-            output += f"{pin}#{note['id']}: {note['content']}{tags}\n"
+            parts.append(f"{pin}#{note['id']}: {note['content']}{tags}\n")
         
-        return output
+        return "".join(parts)
     
     def search(self, query: str) -> str:
         """Search notes."""
-        results = [n for n in self.notes if query.lower() in n["content"].lower()]
+        query_lower = query.lower()
+        with self._lock:
+            candidates = self._candidate_ids(query_lower)
+            ids = self._by_id if candidates is None else sorted(candidates)
+            results = [self._by_id[i] for i in ids if query_lower in self._content_lower[i]]
         
         if not results:
             return f"🔍 No notes found for: {query}"
         
-        output = f"🔍 Notes matching '{query}':\n\n"
-        for note in results:
-            output += f"#{note['id']}: {note['content']}\n"
+        parts = [f"🔍 Notes matching '{query}':\n\n"]
+        parts.extend(f"#{note['id']}: {note['content']}\n" for note in results)
         
-        return output
+        return "".join(parts)
     
     def delete(self, note_id: int) -> str:
         """Delete a note."""
-        self.notes = [n for n in self.notes if n["id"] != note_id]
-        _save_toml(NOTES_FILE, {"items": self.notes})
+        with self._lock:
+            removed = self._by_id.pop(note_id, None) is not None
+            if removed:
+                del self._content_lower[note_id]
+                self._inv_dirty = True
+        if removed:
+            self._mark_dirty()
         return f"🗑️ Deleted note #{note_id}"
     
     def pin(self, note_id: int) -> str:
         """Pin a note."""
-        for note in self.notes:
-            if note["id"] == note_id:
-                note["pinned"] = not note.get("pinned", False)
-                _save_toml(NOTES_FILE, {"items": self.notes})
-                return f"📌 {'Pinned' if note['pinned'] else 'Unpinned'} note #{note_id}"
-        return f"Note #{note_id} not found"
+        with self._lock:
+            note = self._by_id.get(note_id)
+            if note is None:
+                return f"Note #{note_id} not found"
+            note["pinned"] = pinned = not note.get("pinned", False)
+        self._mark_dirty()
+        return f"📌 {'Pinned' if pinned else 'Unpinned'} note #{note_id}"
 
 
 # =============================================================================
 # REMINDERS
 # =============================================================================
 
-class ReminderManager:
+_REL_RE = re.compile(r'(\d+)\s*(m|min|minutes?|h|hr|hours?)')  # "5m", "1h", "30min"
+_ABS_RE = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)?')     # "3pm", "15:00"
+
+
+class ReminderManager(_DebouncedStore):
     """Time-based reminders."""
     
     def __init__(self):
-        self.reminders = _load_toml(REMINDERS_FILE, {"items": []}).get("items", [])
+        super().__init__(REMINDERS_FILE, items=self._snapshot, after_flush=self._reset_log)
+        self._by_id = _index_by_id(_load_toml(REMINDERS_FILE, {"items": []}).get("items", []))
+        self._next_id = max(self._by_id, default=0) + 1
+        # Due times as epoch seconds, parsed once instead of on every check
+        self._due_ts = {i: datetime.fromisoformat(r["time"]).timestamp() for i, r in self._by_id.items()}
+        self._replay_log()
+        self._sorted_pending: Optional[List[Dict]] = None  # by time; None until listed or after a change
+        self._lock = threading.Lock()  # guards the records; the flush timer reads them
         self._checker_thread = None
         self._running = False
     
+    def _snapshot(self) -> List[Dict]:
+        """Current reminders, copied under the lock for the flush timer."""
+        with self._lock:
+            return list(self._by_id.values())
+    
+    def _reset_log(self):
+        """Delete the done log once the TOML holds every done flag."""
+        REMINDERS_LOG.unlink(missing_ok=True)
+    
+    def _replay_log(self):
+        """Apply done flags logged by check_due since the last full save."""
+        try:
+            with open(REMINDERS_LOG, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except (OSError, ValueError):
+            return
+        
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue  # Partial line from a crash mid-append
+        
+        for entry in entries:
+            r = self._by_id.get(entry.get("id"))
+            if r is not None and entry.get("done"):
+                r["done"] = True
+        if entries:
+            self._dirty = True  # compacted into the TOML at the next flush
+    
+    def _log_done(self, due: List[Dict], now_ts: float):
+        """Append due reminders to the log instead of rewriting the whole file."""
+        lines = "".join(json.dumps({"id": r["id"], "done": True, "ts": now_ts}) + "\n" for r in due)
+        with self._flush_lock:
+            DATA_DIR.mkdir(exist_ok=True)
+            with open(REMINDERS_LOG, "a", encoding="utf-8") as f:
+                f.write(lines)
+            self._dirty = True  # compacted into the TOML at the next flush
+    
     def add(self, message: str, when: str) -> str:
         """
         Add a reminder.
@@ -178,15 +378,20 @@ class ReminderManager:
         if not remind_time:
             return f"❌ Couldn't understand time: {when}"
         
-        reminder = {
-            "id": len(self.reminders) + 1,
-            "message": message,
-            "time": remind_time.isoformat(),
-            "created": datetime.now().isoformat(),
-            "done": False
-        }
-        self.reminders.append(reminder)
-        _save_toml(REMINDERS_FILE, {"items": self.reminders})
+        with self._lock:
+            reminder = {
+                "id": self._next_id,
+                "message": message,
+                "time": remind_time.isoformat(),
+                "created": datetime.now().isoformat(),
+                "done": False
+            }
+            self._next_id += 1
+            self._by_id[reminder["id"]] = reminder
+            self._due_ts[reminder["id"]] = remind_time.timestamp()
+            if self._sorted_pending is not None:
+                bisect.insort(self._sorted_pending, reminder, key=lambda r: r["time"])
+        self._mark_dirty()
         
         time_str = remind_time.strftime("%I:%M %p on %b %d")
         return f"⏰ Reminder set for {time_str}: {message}"
@@ -196,9 +401,26 @@ class ReminderManager:
         now = datetime.now()
         when = when.lower().strip()
         
+        # "tomorrow" (plain substring test, so it goes first; "9am tomorrow" lands here too)
+        if "tomorrow" in when:
+            target = now + timedelta(days=1)
+            match = _ABS_RE.search(when)
+            if match:
+                hour = int(match.group(1))
+                minute = int(match.group(2) or 0)
+                if match.group(3) == "pm" and hour < 12:
+                    hour += 12
+                target = target.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            else:
+                target = target.replace(hour=9, minute=0, second=0, microsecond=0)
+            return target
+        
+        # Both time patterns start with a digit
+        if not when[:1].isdigit():
+            return None
+        
         # Relative times: "5m", "1h", "30min"
-        import re
-        match = re.match(r'(\d+)\s*(m|min|minutes?|h|hr|hours?)', when)
+        match = _REL_RE.match(when)
         if match:
             amount = int(match.group(1))
             unit = match.group(2)
@@ -208,7 +430,7 @@ class ReminderManager:
                 return now + timedelta(hours=amount)
         
         # Absolute times: "3pm", "15:00"
-        match = re.match(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)?', when)
+        match = _ABS_RE.match(when)
         if match:
             hour = int(match.group(1))
             minute = int(match.group(2) or 0)
@@ -224,69 +446,65 @@ class ReminderManager:
                 target += timedelta(days=1)
             return target
         
-        # "tomorrow"
-        if "tomorrow" in when:
-            target = now + timedelta(days=1)
-            match = re.search(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)?', when)
-            if match:
-                hour = int(match.group(1))
-                minute = int(match.group(2) or 0)
-                if match.group(3) == "pm" and hour < 12:
-                    hour += 12
-                target = target.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            else:
-                target = target.replace(hour=9, minute=0, second=0, microsecond=0)
-            return target
-        
         return None
     
     def list_all(self) -> str:
         """List pending reminders."""
-        pending = [r for r in self.reminders if not r.get("done")]
+        with self._lock:
+            if self._sorted_pending is None:
+                # ISO-8601 strings sort in time order
+                self._sorted_pending = sorted(
+                    (r for r in self._by_id.values() if not r.get("done")),
+                    key=lambda r: r["time"]
+                )
+            pending = self._sorted_pending
         
         if not pending:
             return "⏰ No pending reminders"
         
-        output = "⏰ REMINDERS\n" + "="*40 + "\n\n"
+        parts = ["⏰ REMINDERS\n" + "="*40 + "\n\n"]
         
-        for r in sorted(pending, key=lambda x: x["time"]):
+        for r in pending:
             time_obj = datetime.fromisoformat(r["time"])
             time_str = time_obj.strftime("%I:%M %p, %b %d")
-            output += f"#{r['id']}: {r['message']}\n   ⏰ {time_str}\n\n"
+            parts.append(f"#{r['id']}: {r['message']}\n   ⏰ {time_str}\n\n")
         
-        return output
+        return "".join(parts)
     
     def complete(self, reminder_id: int) -> str:
         """Mark reminder as done."""
-        for r in self.reminders:
-            if r["id"] == reminder_id:
-                r["done"] = True
-                _save_toml(REMINDERS_FILE, {"items": self.reminders})
-                return f"✅ Completed: {r['message']}"
-        return f"Reminder #{reminder_id} not found"
+        with self._lock:
+            r = self._by_id.get(reminder_id)
+            if r is None:
+                return f"Reminder #{reminder_id} not found"
+            r["done"] = True
+            self._sorted_pending = None
+        self._mark_dirty()
+        return f"✅ Completed: {r['message']}"
     
     def delete(self, reminder_id: int) -> str:
         """Delete a reminder."""
-        self.reminders = [r for r in self.reminders if r["id"] != reminder_id]
-        _save_toml(REMINDERS_FILE, {"items": self.reminders})
+        with self._lock:
+            removed = self._by_id.pop(reminder_id, None) is not None
+            if removed:
+                del self._due_ts[reminder_id]
+                self._sorted_pending = None
+        if removed:
+            self._mark_dirty()
         return f"🗑️ Deleted reminder #{reminder_id}"
     
     def check_due(self) -> List[Dict]:
         """Check for due reminders."""
-        now = datetime.now()
-        due = []
-        
-        for r in self.reminders:
-            if r.get("done"):
-                continue
-            
-            remind_time = datetime.fromisoformat(r["time"])
-            if remind_time <= now:
-                due.append(r)
+        now_ts = time.time()
+        with self._lock:
+            due = [r for r in self._by_id.values() if not r.get("done") and self._due_ts[r["id"]] <= now_ts]
+            for r in due:
                 r["done"] = True
+            if due and self._sorted_pending is not None:
+                self._sorted_pending = [r for r in self._sorted_pending if not r.get("done")]
         
         if due:
-            _save_toml(REMINDERS_FILE, {"items": self.reminders})
+            self._log_done(due, now_ts)
         
         return due
     
@@ -317,44 +535,72 @@ class ReminderManager:
 # GLOBAL INSTANCES
 # =============================================================================
 
-_notes = NoteManager()
-_reminders = ReminderManager()
+_instances = {}
+_instances_lock = threading.Lock()
+
+
+def _get_manager(name: str, factory):
+    """Create a shared manager on first use rather than at import."""
+    manager = _instances.get(name)
+    if manager is None:
+        with _instances_lock:
+            manager = _instances.get(name)
+            if manager is None:
+                manager = _instances[name] = factory()
+    return manager
+
+
+def _get_notes() -> NoteManager:
+    return _get_manager("notes", NoteManager)
+
+
+def _get_reminders() -> ReminderManager:
+    return _get_manager("reminders", ReminderManager)
+
+
+def __getattr__(name: str):
+    # Keep the old module-level _notes / _reminders names working
+    if name == "_notes":
+        return _get_notes()
+    if name == "_reminders":
+        return _get_reminders()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Convenience functions
 def note(content: str, tags: List[str] = None) -> str:
     """Add a quick note."""
-    return _notes.add(content, tags)
+    return _get_notes().add(content, tags)
 
 
 def notes(limit: int = 10) -> str:
     """List notes."""
-    return _notes.list_all(limit)
+    return _get_notes().list_all(limit)
 
 
 def search_notes(query: str) -> str:
     """Search notes."""
-    return _notes.search(query)
+    return _get_notes().search(query)
 
 
 def delete_note(note_id: int) -> str:
     """Delete a note."""
-    return _notes.delete(note_id)
+    return _get_notes().delete(note_id)
 
 
 def remind(message: str, when: str) -> str:
     """Set a reminder."""
-    return _reminders.add(message, when)
+    return _get_reminders().add(message, when)
 
 
 def reminders() -> str:
     """List reminders."""
-    return _reminders.list_all()
+    return _get_reminders().list_all()
 
 
 def complete_reminder(reminder_id: int) -> str:
     """Complete a reminder."""
-    return _reminders.complete(reminder_id)
+    return _get_reminders().complete(reminder_id)
 
 
 # =============================================================================
@@ -383,4 +629,4 @@ if __name__ == "__main__":
     elif args.command == "reminders":
         print(reminders())
     elif args.command == "check":
-        _reminders.notify_due()
+        _get_reminders().notify_due()
@@ -10,6 +10,8 @@ import webbrowser
 from typing import Optional, Dict, List
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from urllib.parse import quote_plus
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -199,6 +201,22 @@ PRODUCT_SPECS = {
     }
 }
 
+# Lowercased display names, and exact product words -> product key
+_PRODUCT_NAME_LOWER = {key: spec["name"].lower() for key, spec in PRODUCT_SPECS.items()}
+
+
+def _build_product_lookup() -> Dict[str, str]:
+    """Map product keys and the words of product names to product keys."""
+    lookup = {}
+    for key, name in _PRODUCT_NAME_LOWER.items():
+        for word in name.split():
+            lookup.setdefault(word, key)  # The first product using a word keeps it
+    lookup.update({key: key for key in PRODUCT_SPECS})  # Keys win over name words
+    return lookup
+
+
+_PRODUCT_LOOKUP = _build_product_lookup()
+
 # Shopping sites
 SHOPPING_SITES = {
     "amazon": "https://www.amazon.in/s?k=",
@@ -207,6 +225,12 @@ SHOPPING_SITES = {
 }
 
 
+@lru_cache(maxsize=256)
+def _build_url(site: str, query: str) -> str:
+    """Search URL for a query on a shopping site (Amazon if the site is unknown)."""
+    return SHOPPING_SITES.get(site, SHOPPING_SITES["amazon"]) + quote_plus(query)
+
+
 # =============================================================================
 # SHOPPING ASSISTANT
 # =============================================================================
@@ -223,15 +247,13 @@ class ShoppingAssistant:
         """Start a new shopping session."""
         product_lower = product.lower().strip()
         
-        # Find matching product
-        matched_product = None
-        for key, spec in PRODUCT_SPECS.items():
-            if key in product_lower or product_lower in key:
-                matched_product = key
-                break
-            if product_lower in spec["name"].lower():
-                matched_product = key
-                break
+        # Find matching product: exact key or name word first, then substring scan
+        matched_product = _PRODUCT_LOOKUP.get(product_lower)
+        if not matched_product:
+            for key, name_lower in _PRODUCT_NAME_LOWER.items():
+                if key in product_lower or product_lower in key or product_lower in name_lower:
+                    matched_product = key
+                    break
         
         if not matched_product:
             available = ", ".join(PRODUCT_SPECS.keys())
@@ -309,25 +331,29 @@ Or tell me what you're looking for and I'll do a general search!"""
         search_terms = " ".join(search_terms.split())  # Clean extra spaces
         
         # Generate summary
-        output = f"""✅ Perfect! Here's what I found based on your preferences:
+        parts = [f"""✅ Perfect! Here's what I found based on your preferences:
 
 🛒 **{spec['name']}**
 
 📋 **Your Requirements:**
-"""
-        for key, value in self.preferences.items():
-            output += f"  • {key.replace('_', ' ').title()}: {value}\n"
+"""]
+        parts.extend(
+            f"  • {key.replace('_', ' ').title()}: {value}\n"
+            for key, value in self.preferences.items()
+        )
         
-        output += f"\n🔍 **Search Query:** `{search_terms}`\n\n"
-        output += "🛍️ **Shop Now:**\n"
+        parts.append(f"\n🔍 **Search Query:** `{search_terms}`\n\n")
+        parts.append("🛍️ **Shop Now:**\n")
         
         # Generate links
-        encoded_query = search_terms.replace(" ", "+")
-        for site, base_url in SHOPPING_SITES.items():
-            url = base_url + encoded_query
-            output += f"  • [{site.title()}]({url})\n"
+        encoded_query = quote_plus(search_terms)
+        parts.extend(
+            f"  • [{site.title()}]({base_url + encoded_query})\n"
+            for site, base_url in SHOPPING_SITES.items()
+        )
         
-        output += "\n💡 Shall I open any of these in your browser?"
+        parts.append("\n💡 Shall I open any of these in your browser?")
+        output = "".join(parts)
         
         # Reset session
         self.current_product = None
@@ -338,8 +364,7 @@ Or tell me what you're looking for and I'll do a general search!"""
     
     def quick_search(self, query: str, site: str = "amazon") -> str:
         """Quick search without preferences."""
-        encoded = query.replace(" ", "+")
-        url = SHOPPING_SITES.get(site, SHOPPING_SITES["amazon"]) + encoded
+        url = _build_url(site, query)
         
         webbrowser.open(url)
         return f"🛒 Opened {site.title()} search for: {query}"
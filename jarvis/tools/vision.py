@@ -5,6 +5,7 @@ Also includes Tesseract OCR fallback for text-heavy content.
 """
 
 import base64
+import importlib.util
 import json
 import os
 import sys
@@ -33,12 +34,9 @@ try:
 except ImportError:
     pass
 
-EASYOCR_AVAILABLE = False
-try:
-    import easyocr
-    EASYOCR_AVAILABLE = True
-except ImportError:
-    pass
+# EasyOCR pulls in torch, and this module is loaded with the tools package.
+# Only check that it's installed here; import it on first OCR use.
+EASYOCR_AVAILABLE = importlib.util.find_spec("easyocr") is not None
 
 from config import OLLAMA_HOST
 from .registry import tool
@@ -205,6 +203,7 @@ def _get_ocr_reader():
     global _ocr_reader
     if _ocr_reader is None and EASYOCR_AVAILABLE:
         try:
+            import easyocr
             print("    👀 Loading EasyOCR model (one-time setup)...")
             # verbose=False to keep logs clean
             _ocr_reader = easyocr.Reader(['en'], gpu=True, verbose=False) 
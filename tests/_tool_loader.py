@@ -0,0 +1,45 @@
+"""
+Load a single jarvis/tools module for testing.
+
+Importing through the `jarvis.tools` package runs its __init__, which imports
+every tool and their heavy dependencies (cv2, dotenv, ...). This loads just the
+requested file under a bare `tools` package so a test only needs what that
+module itself imports.
+"""
+
+import importlib.util
+import os
+import sys
+import types
+
+JARVIS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "jarvis")
+TOOLS_DIR = os.path.join(JARVIS_DIR, "tools")
+
+
+def load_tool_module(name: str) -> types.ModuleType:
+    """Import jarvis/tools/<name>.py on its own; raises ImportError if its dependencies are missing."""
+    saved_modules = dict(sys.modules)
+    saved_path = list(sys.path)
+
+    # Bare package so `from .registry import ...` / `from tools.registry import ...` resolve
+    package = types.ModuleType("tools")
+    package.__path__ = [TOOLS_DIR]
+    sys.modules["tools"] = package
+    sys.path.insert(0, JARVIS_DIR)  # for `from config import ...`
+
+    try:
+        spec = importlib.util.spec_from_file_location(f"tools.{name}", os.path.join(TOOLS_DIR, f"{name}.py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        return module
+    finally:
+        # Leave sys.modules as found so the real `jarvis.tools` package still imports normally
+        for key in list(sys.modules):
+            if key in ("tools", "config") or key.startswith("tools."):
+                if key in saved_modules:
+                    sys.modules[key] = saved_modules[key]
+                else:
+                    del sys.modules[key]
+        sys.path[:] = saved_path
+
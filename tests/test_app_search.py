@@ -0,0 +1,88 @@
+import sys
+import os
+import random
+import re
+import unittest
+
+from _tool_loader import load_tool_module
+
+try:
+    pc_control = load_tool_module("pc_control")
+except ImportError as e:
+    raise unittest.SkipTest(f"pc_control dependencies missing: {e}")
+
+APPS = {
+    "google chrome": r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    "chrome": r"C:\Users\me\AppData\Local\Chromium\chrome.exe",
+    "visual studio code": r"C:\Users\me\AppData\Local\Programs\Microsoft VS Code\Code.exe",
+    "code": r"C:\Tools\code.exe",
+    "notepad": r"C:\Windows\notepad.exe",
+    "notepad++": r"C:\Program Files\Notepad++\notepad++.exe",
+    "spotify": r"C:\Users\me\AppData\Roaming\Spotify\Spotify.exe",
+    "microsoft edge": r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
+    "7-zip file manager": r"C:\Program Files\7-Zip\7zFM.exe",
+    "vlc media player": r"C:\Program Files\VideoLAN\VLC\vlc.exe",
+}
+
+QUERIES = [
+    "", "c", "ch", "chrome", "google chrome browser", "code", "studio", "note",
+    "notepad++", "program files", "appdata", "msedge", "videolan", "7-z", "xyz",
+    "open spotify now", "edge", "me",
+]
+
+
+def plain_fuzzy_match(query, apps):
+    """First app (discovery order) whose name contains query or is contained in it."""
+    for name, path in apps.items():
+        if query in name or name in query:
+            return path
+    return None
+
+
+def plain_search(query, apps):
+    query = query.lower().strip()
+    return sorted(name for name, path in apps.items() if query in name or query in path.lower())
+
+
+def listed_names(output):
+    return sorted(re.findall(r"^  • (.*)$", output, re.MULTILINE))
+
+
+class TestAppSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.apps = dict(APPS)
+        rng = random.Random(0)
+        texts = list(self.apps) + [p.lower() for p in self.apps.values()]
+        self.queries = list(QUERIES)
+        for _ in range(200):
+            text = rng.choice(texts)
+            start = rng.randrange(len(text))
+            self.queries.append(text[start:start + rng.randint(1, 8)])
+        self._discover = pc_control.discover_installed_apps
+        pc_control.discover_installed_apps = lambda force_refresh=False: self.apps
+
+    def tearDown(self):
+        pc_control.discover_installed_apps = self._discover
+
+    def test_fuzzy_app_match_matches_plain_scan(self):
+        for query in self.queries:
+            with self.subTest(query=query):
+                self.assertEqual(pc_control._fuzzy_app_match(query, self.apps), plain_fuzzy_match(query, self.apps))
+
+    def test_fuzzy_app_match_ignores_paths(self):
+        """Only names count; a query found only in an install path is not a match."""
+        self.assertIsNone(pc_control._fuzzy_app_match("videolan", self.apps))
+
+    def test_search_installed_apps_matches_plain_scan(self):
+        for query in self.queries:
+            expected = plain_search(query, self.apps)
+            if not expected:
+                continue  # The no-match message depends on rapidfuzz being installed
+            with self.subTest(query=query):
+                self.assertEqual(listed_names(pc_control.search_installed_apps(query)), expected)
+
+    def test_search_installed_apps_finds_path_only_match(self):
+        self.assertEqual(listed_names(pc_control.search_installed_apps("VideoLAN")), ["vlc media player"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+from _tool_loader import load_tool_module
+
+try:
+    _fast_rmtree = load_tool_module("file_manager")._fast_rmtree
+except ImportError as e:
+    raise unittest.SkipTest(f"file_manager dependencies missing: {e}")
+
+class TestFastRmtree(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.real = os.path.join(self.tmp, "real")
+        os.makedirs(os.path.join(self.real, "sub"))
+        with open(os.path.join(self.real, "keep.txt"), "w") as f:
+            f.write("data")
+        with open(os.path.join(self.real, "sub", "inner.txt"), "w") as f:
+            f.write("data")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_removes_tree(self):
+        _fast_rmtree(self.real)
+        self.assertFalse(os.path.exists(self.real))
+
+    def test_symlinked_root_keeps_target(self):
+        """Deleting a link to a directory must not empty the real directory."""
+        link = os.path.join(self.tmp, "link")
+        try:
+            os.symlink(self.real, link, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            self.skipTest("symlinks not supported here")
+
+        _fast_rmtree(link)
+
+        self.assertFalse(os.path.lexists(link))
+        self.assertTrue(os.path.isfile(os.path.join(self.real, "keep.txt")))
+        self.assertTrue(os.path.isfile(os.path.join(self.real, "sub", "inner.txt")))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import sys
+import os
+import unittest
+
+from _tool_loader import load_tool_module
+
+try:
+    IncrementalMatcher = load_tool_module("pc_control").IncrementalMatcher
+except ImportError as e:
+    raise unittest.SkipTest(f"pc_control dependencies missing: {e}")
+
+NAMES = ["google chrome", "chrome", "code", "visual studio code", "notepad", "notepad++", "spotify"]
+
+
+def best_distance(query, name):
+    """Edit distance from query to the closest substring of name, computed from scratch."""
+    prev = [0] * (len(name) + 1)
+    for char in query:
+        row = [prev[0] + 1]
+        for j, name_char in enumerate(name, 1):
+            row.append(min(prev[j] + 1, row[j - 1] + 1, prev[j - 1] + (name_char != char)))
+        prev = row
+    return min(prev)
+
+
+class TestIncrementalMatcher(unittest.TestCase):
+    def setUp(self):
+        self.matcher = IncrementalMatcher(NAMES)
+
+    def assertMatchesScratch(self, query):
+        self.assertEqual(self.matcher.query, query)
+        expected = sorted((best_distance(query, n), len(n), i) for i, n in enumerate(NAMES))
+        self.assertEqual(
+            self.matcher.top_k(len(NAMES)),
+            [(dist, NAMES[i]) for dist, _, i in expected],
+        )
+
+    def test_append_character(self):
+        for char in "notpad":
+            self.matcher.extend(char)
+            self.assertMatchesScratch(self.matcher.query)
+
+    def test_backspace(self):
+        self.matcher.set_query("spotx")
+        self.matcher.set_query("spot")
+        self.assertMatchesScratch("spot")
+        self.matcher.set_query("")
+        self.assertMatchesScratch("")
+
+    def test_replace_after_shared_prefix(self):
+        self.matcher.set_query("chrome")
+        self.matcher.set_query("chord")
+        self.assertMatchesScratch("chord")
+        self.matcher.set_query("visual")
+        self.assertMatchesScratch("visual")
+
+    def test_semi_global_scoring(self):
+        """A query matching part of a name costs nothing for the rest of the name."""
+        self.matcher.set_query("chro")
+        scores = dict((name, dist) for dist, name in self.matcher.top_k(len(NAMES)))
+        self.assertEqual(scores["google chrome"], 0)
+        self.assertEqual(scores["chrome"], 0)
+        self.assertEqual(scores["code"], 2)
+
+    def test_top_k_prefers_shorter_names_on_ties(self):
+        self.matcher.set_query("chro")
+        self.assertEqual(self.matcher.top_k(2), [(0, "chrome"), (0, "google chrome")])
+        self.matcher.set_query("notepad")
+        self.assertEqual(self.matcher.top_k(1), [(0, "notepad")])
+
+    def test_top_k_keeps_candidate_order_on_full_ties(self):
+        matcher = IncrementalMatcher(["abc", "xbc", "abd"])
+        matcher.set_query("bc")
+        self.assertEqual(matcher.top_k(3), [(0, "abc"), (0, "xbc"), (1, "abd")])
+
+if __name__ == '__main__':
+    unittest.main()
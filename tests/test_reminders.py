@@ -0,0 +1,163 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from _tool_loader import load_tool_module
+
+reminders = load_tool_module("reminders")
+
+if reminders.tomllib is None:
+    raise unittest.SkipTest("tomllib/tomli not available")
+
+
+class RemindersTestCase(unittest.TestCase):
+    """Points the storage paths at a temp dir; managers made with make() are flushed before it goes."""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self._saved_paths = {
+            name: getattr(reminders, name)
+            for name in ("DATA_DIR", "NOTES_FILE", "REMINDERS_FILE", "REMINDERS_LOG")
+        }
+        reminders.DATA_DIR = self.tmp
+        reminders.NOTES_FILE = self.tmp / "notes.toml"
+        reminders.REMINDERS_FILE = self.tmp / "reminders.toml"
+        reminders.REMINDERS_LOG = self.tmp / "reminders.log"
+        reminders._parse_toml.cache_clear()
+        self._managers = []
+
+    def tearDown(self):
+        for manager in self._managers:
+            manager._flush()
+        for name, value in self._saved_paths.items():
+            setattr(reminders, name, value)
+        reminders._parse_toml.cache_clear()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def make(self, cls):
+        manager = cls()
+        self._managers.append(manager)
+        return manager
+
+
+class TestDuplicateIds(RemindersTestCase):
+    def test_duplicate_note_ids_are_renumbered(self):
+        reminders.NOTES_FILE.write_text(
+            "[[items]]\nid = 1\ncontent = \"first\"\n\n"
+            "[[items]]\nid = 1\ncontent = \"second\"\n\n"
+            "[[items]]\nid = 2\ncontent = \"third\"\n",
+            encoding="utf-8",
+        )
+        notes = self.make(reminders.NoteManager)
+
+        contents = {note_id: note["content"] for note_id, note in notes._by_id.items()}
+        self.assertEqual(contents, {1: "first", 3: "second", 2: "third"})
+
+        notes.delete(3)
+        self.assertIn("#4", notes.add("fourth"))
+        self.assertIn("#5", notes.add("fifth"))
+
+    def test_duplicate_reminder_ids_are_renumbered(self):
+        reminders.REMINDERS_FILE.write_text(
+            "[[items]]\nid = 5\nmessage = \"a\"\ntime = \"2030-01-01T09:00:00\"\ndone = false\n\n"
+            "[[items]]\nid = 5\nmessage = \"b\"\ntime = \"2030-01-02T09:00:00\"\ndone = false\n",
+            encoding="utf-8",
+        )
+        manager = self.make(reminders.ReminderManager)
+
+        self.assertEqual(sorted(r["message"] for r in manager._by_id.values()), ["a", "b"])
+        self.assertEqual(sorted(manager._by_id), [5, 6])
+
+        manager.delete(6)
+        manager.add("c", "5m")
+        self.assertEqual(sorted(manager._by_id), [5, 7])
+
+
+class TestDoneLog(RemindersTestCase):
+    STALE_TOML = (
+        "[[items]]\nid = 1\nmessage = \"stretch\"\ntime = \"2020-01-01T09:00:00\"\ndone = false\n\n"
+        "[[items]]\nid = 2\nmessage = \"water\"\ntime = \"2020-01-01T10:00:00\"\ndone = false\n\n"
+        "[[items]]\nid = 3\nmessage = \"later\"\ntime = \"2099-01-01T10:00:00\"\ndone = false\n"
+    )
+
+    def done_ids(self, manager):
+        return sorted(r["id"] for r in manager._by_id.values() if r.get("done"))
+
+    def test_replay_after_crash(self):
+        """Done flags logged before a crash are applied over the stale TOML."""
+        reminders.REMINDERS_FILE.write_text(self.STALE_TOML, encoding="utf-8")
+        reminders.REMINDERS_LOG.write_text(
+            '{"id": 1, "done": true, "ts": 0}\n{"id": 2, "done": true, "ts": 0}\n', encoding="utf-8"
+        )
+        manager = self.make(reminders.ReminderManager)
+
+        self.assertEqual(self.done_ids(manager), [1, 2])
+        self.assertEqual(manager.check_due(), [])
+
+    def test_flush_deletes_log(self):
+        reminders.REMINDERS_FILE.write_text(self.STALE_TOML, encoding="utf-8")
+        manager = self.make(reminders.ReminderManager)
+
+        self.assertEqual(sorted(r["id"] for r in manager.check_due()), [1, 2])
+        self.assertTrue(reminders.REMINDERS_LOG.exists())
+
+        manager._flush()
+        self.assertFalse(reminders.REMINDERS_LOG.exists())
+
+        reloaded = self.make(reminders.ReminderManager)
+        self.assertEqual(self.done_ids(reloaded), [1, 2])
+
+    def test_partial_last_line_is_ignored(self):
+        """A line cut off mid-append does not discard the complete lines before it."""
+        reminders.REMINDERS_FILE.write_text(self.STALE_TOML, encoding="utf-8")
+        reminders.REMINDERS_LOG.write_text('{"id": 1, "done": true, "ts": 0}\n{"id": 2, "do', encoding="utf-8")
+        manager = self.make(reminders.ReminderManager)
+
+        self.assertEqual(self.done_ids(manager), [1])
+
+
+class FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 3, 10, 10, 30, 15)
+
+
+class TestParseTime(RemindersTestCase):
+    def setUp(self):
+        super().setUp()
+        self._datetime = reminders.datetime
+        reminders.datetime = FixedDatetime
+        self.manager = self.make(reminders.ReminderManager)
+
+    def tearDown(self):
+        reminders.datetime = self._datetime
+        super().tearDown()
+
+    def test_formats(self):
+        cases = {
+            "5m": datetime(2026, 3, 10, 10, 35, 15),
+            "5 minutes": datetime(2026, 3, 10, 10, 35, 15),
+            "1h": datetime(2026, 3, 10, 11, 30, 15),
+            "3pm": datetime(2026, 3, 10, 15, 0),
+            "15": datetime(2026, 3, 10, 15, 0),
+            "15:00": datetime(2026, 3, 10, 15, 0),
+            "9am": datetime(2026, 3, 11, 9, 0),  # already past today
+            "tomorrow": datetime(2026, 3, 11, 9, 0),
+            "9am tomorrow": datetime(2026, 3, 11, 9, 0),
+            "tomorrow 3pm": datetime(2026, 3, 11, 15, 0),
+        }
+        for when, expected in cases.items():
+            with self.subTest(when=when):
+                self.assertEqual(self.manager._parse_time(when), expected)
+
+    def test_unparseable(self):
+        for when in ("", "later", "soon-ish"):
+            with self.subTest(when=when):
+                self.assertIsNone(self.manager._parse_time(when))
+
+if __name__ == '__main__':
+    unittest.main()
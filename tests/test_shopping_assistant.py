@@ -0,0 +1,40 @@
+import sys
+import os
+import unittest
+
+from _tool_loader import load_tool_module
+
+shopping_assistant = load_tool_module("shopping_assistant")
+
+
+class TestStartShopping(unittest.TestCase):
+    def setUp(self):
+        self.assistant = shopping_assistant.ShoppingAssistant()
+
+    def start(self, product):
+        output = self.assistant.start_shopping(product)
+        return self.assistant.current_product, output
+
+    def test_phone_goes_to_smartphone(self):
+        """The "phone" key wins over the substring match in "headphones"."""
+        product, output = self.start("phone")
+        self.assertEqual(product, "phone")
+        self.assertIn("Shopping for: Smartphone", output)
+
+    def test_name_word_hit(self):
+        self.assertEqual(self.start("earbuds")[0], "headphones")
+        self.assertEqual(self.start("  USB ")[0], "pendrive")
+        self.assertEqual(self.start("smartphone")[0], "phone")
+
+    def test_miss_falls_back_to_substring_scan(self):
+        self.assertNotIn("gaming laptop", shopping_assistant._PRODUCT_LOOKUP)
+        self.assertEqual(self.start("gaming laptop")[0], "laptop")
+        self.assertEqual(self.start("head")[0], "headphones")
+
+    def test_unknown_product(self):
+        product, output = self.start("toaster")
+        self.assertIsNone(product)
+        self.assertIn("I don't have specifications for 'toaster'", output)
+
+if __name__ == '__main__':
+    unittest.main()